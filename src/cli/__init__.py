@@ -1,12 +1,13 @@
 """CLI foundation for Graphiti knowledge graph operations.
 
 This module provides the Typer app instance that all commands register with,
-along with the entry point function for console_scripts.
+along with cli_entry(), which the src.entry console script calls to run it.
 """
 import sys
 import typer
 from typing import Optional
 from src.cli.output import err_console, print_error
+from src.entry import get_version
 
 
 # Create main Typer app
@@ -27,13 +28,7 @@ def main_callback(
 ):
     """Main callback that handles version display and unknown command suggestions."""
     if version:
-        # Import here to avoid circular dependency
-        import importlib.metadata
-        try:
-            version_str = importlib.metadata.version("graphiti-knowledge-graph")
-        except importlib.metadata.PackageNotFoundError:
-            version_str = "0.1.0 (development)"
-        typer.echo(f"graphiti version {version_str}")
+        typer.echo(f"graphiti version {get_version()}")
         raise typer.Exit(0)
 
     # If command invoked but not found, suggest alternatives
@@ -43,9 +38,10 @@ def main_callback(
 
 
 def cli_entry():
-    """Entry point for console_scripts.
+    """Run the Typer app, mapping uncaught errors to exit codes.
 
-    This function is registered in pyproject.toml as both 'graphiti' and 'gk'.
+    The console scripts go through src.entry.cli_entry, which answers
+    --version before this module is imported.
     """
     try:
         app()
@@ -0,0 +1,231 @@
+"""On-disk caches for graph statistics and health checks shown by CLI commands.
+
+Graph stats require several Kuzu count queries plus a walk of the database
+directory. The result only changes when the graph changes, so it is cached in
+~/.graphiti/cache/stats.json keyed by scope and validated against the
+database's write generation (bumped by every write) and file size.
+
+Health check results depend on external services, so they are cached in
+~/.graphiti/cache/health.json with a per-entry TTL chosen by the caller.
+
+Search results are cached per scope, keyed by the query and its options and
+validated against the same database fingerprint as the stats, so a repeated
+search skips the embedding call and the graph query until the graph changes.
+Global results live in ~/.graphiti/cache/search.json; project results stay
+inside the project, in .graphiti/cache/search.json.
+"""
+import json
+from pathlib import Path
+from typing import Optional
+
+from src.config.paths import GLOBAL_DB_PATH, get_project_db_path
+from src.models import GraphScope
+from src.storage.write_generation import read_write_generation
+
+STATS_CACHE_PATH = Path.home() / ".graphiti" / "cache" / "stats.json"
+HEALTH_CACHE_PATH = Path.home() / ".graphiti" / "cache" / "health.json"
+SEARCH_CACHE_PATH = Path.home() / ".graphiti" / "cache" / "search.json"
+
+# Queries kept per scope; the oldest entry is dropped first
+_SEARCH_CACHE_SIZE = 50
+
+
+def _db_path(scope: GraphScope, project_root: Optional[Path]) -> Optional[Path]:
+    """Return the database path for a scope, or None if it has none."""
+    if scope == GraphScope.GLOBAL:
+        return GLOBAL_DB_PATH
+    return get_project_db_path(project_root) if project_root else None
+
+
+def _search_cache_path(scope: GraphScope, project_root: Optional[Path]) -> Optional[Path]:
+    """Return the search cache file for a scope, kept next to its database."""
+    if scope == GraphScope.GLOBAL:
+        return SEARCH_CACHE_PATH
+    db_path = _db_path(scope, project_root)
+    return db_path.parent / "cache" / "search.json" if db_path else None
+
+
+def _scope_key(scope: GraphScope, project_root: Optional[Path]) -> str:
+    """Return the cache entry key for a scope."""
+    if scope == GraphScope.GLOBAL:
+        return "global"
+    return f"project:{project_root.resolve()}" if project_root else "project:none"
+
+
+def _db_fingerprint(scope: GraphScope, project_root: Optional[Path]) -> str:
+    """Return a cheap key that changes whenever the graph for a scope is written.
+
+    Combines the write generation the graph service bumps on every write with
+    the database file size, so a database replaced or grown outside this
+    package is not served stale results either. The mtime is not used: Kuzu
+    updates it on every close, even after read-only work.
+    """
+    db_path = _db_path(scope, project_root)
+    if db_path is None:
+        return ""
+    try:
+        size = db_path.stat().st_size
+    except OSError:
+        return ""
+    return f"{read_write_generation(db_path)}:{size}"
+
+
+def _load(path: Path) -> dict:
+    """Load a cache file, returning an empty dict if missing or malformed."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save(path: Path, data: dict) -> None:
+    """Atomically write a cache file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(data), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def get_cached_stats(scope: GraphScope, project_root: Optional[Path]) -> Optional[dict]:
+    """Return cached stats for a scope if the database is unchanged.
+
+    Args:
+        scope: Graph scope
+        project_root: Project root path (for PROJECT scope)
+
+    Returns:
+        Stats dict on cache hit, None on miss or stale entry
+    """
+    entry = _load(STATS_CACHE_PATH).get(_scope_key(scope, project_root))
+    if not entry or entry.get("fingerprint") != _db_fingerprint(scope, project_root):
+        return None
+    return entry.get("stats")
+
+
+def set_cached_stats(scope: GraphScope, project_root: Optional[Path], stats: dict) -> None:
+    """Store stats for a scope alongside the current database fingerprint.
+
+    Best-effort: failures to write the cache are ignored.
+
+    Args:
+        scope: Graph scope
+        project_root: Project root path (for PROJECT scope)
+        stats: Stats dict to cache
+    """
+    data = _load(STATS_CACHE_PATH)
+    data[_scope_key(scope, project_root)] = {
+        "fingerprint": _db_fingerprint(scope, project_root),
+        "stats": stats,
+    }
+    try:
+        _save(STATS_CACHE_PATH, data)
+    except OSError:
+        pass
+
+
+def invalidate_stats(scope: GraphScope, project_root: Optional[Path]) -> None:
+    """Drop the cached stats entry for a scope.
+
+    Args:
+        scope: Graph scope
+        project_root: Project root path (for PROJECT scope)
+    """
+    data = _load(STATS_CACHE_PATH)
+    if data.pop(_scope_key(scope, project_root), None) is not None:
+        try:
+            _save(STATS_CACHE_PATH, data)
+        except OSError:
+            pass
+
+
+def get_cached_health(now: float) -> dict[str, dict]:
+    """Return cached health check results that are still within their TTL.
+
+    Args:
+        now: Current time as a Unix timestamp
+
+    Returns:
+        Mapping of check cache key (e.g. "ollama_local", "database:<path>")
+        to its result dict; expired entries are omitted
+    """
+    return {
+        key: entry["result"]
+        for key, entry in _load(HEALTH_CACHE_PATH).items()
+        if "result" in entry and now - entry.get("ts", 0) < entry.get("ttl", 0)
+    }
+
+
+def set_cached_health(results: dict[str, tuple[dict, float]], now: float) -> None:
+    """Store health check results with their TTLs.
+
+    Best-effort: failures to write the cache are ignored.
+
+    Args:
+        results: Mapping of check cache key to (result dict, TTL in seconds)
+        now: Timestamp the results were computed at
+    """
+    data = _load(HEALTH_CACHE_PATH)
+    for key, (result, ttl) in results.items():
+        data[key] = {"result": result, "ts": now, "ttl": ttl}
+    try:
+        _save(HEALTH_CACHE_PATH, data)
+    except OSError:
+        pass
+
+
+def get_cached_search(
+    scope: GraphScope, project_root: Optional[Path], key: str
+) -> Optional[list[dict]]:
+    """Return cached results for a search if the database is unchanged.
+
+    Args:
+        scope: Graph scope
+        project_root: Project root path (for PROJECT scope)
+        key: Cache key identifying the query and its options
+
+    Returns:
+        Result list on cache hit, None on miss or stale entry
+    """
+    cache_path = _search_cache_path(scope, project_root)
+    if cache_path is None:
+        return None
+    entry = _load(cache_path).get(_scope_key(scope, project_root))
+    if not entry or entry.get("fingerprint") != _db_fingerprint(scope, project_root):
+        return None
+    return entry.get("queries", {}).get(key)
+
+
+def set_cached_search(
+    scope: GraphScope, project_root: Optional[Path], key: str, results: list[dict]
+) -> None:
+    """Store search results for a scope alongside the current database fingerprint.
+
+    Entries cached against an older fingerprint are discarded. Best-effort:
+    failures to write the cache are ignored.
+
+    Args:
+        scope: Graph scope
+        project_root: Project root path (for PROJECT scope)
+        key: Cache key identifying the query and its options
+        results: Search results to cache
+    """
+    cache_path = _search_cache_path(scope, project_root)
+    if cache_path is None:
+        return
+
+    data = _load(cache_path)
+    scope_key = _scope_key(scope, project_root)
+    fingerprint = _db_fingerprint(scope, project_root)
+
+    entry = data.get(scope_key)
+    queries = entry["queries"] if entry and entry.get("fingerprint") == fingerprint else {}
+    queries.pop(key, None)
+    queries[key] = results
+    while len(queries) > _SEARCH_CACHE_SIZE:
+        del queries[next(iter(queries))]
+
+    data[scope_key] = {"fingerprint": fingerprint, "queries": queries}
+    try:
+        _save(cache_path, data)
+    except OSError:
+        pass
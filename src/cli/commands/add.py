@@ -9,13 +9,10 @@ from datetime import datetime
 from pathlib import Path
 
 from src.cli.input import read_content
-from src.cli.output import console, print_success, print_json, print_error
+from src.cli.output import print_success, print_json, print_error, maybe_status
 from src.cli.utils import resolve_scope, EXIT_SUCCESS, EXIT_ERROR
 from src.models import GraphScope
 from src.config.paths import get_project_db_path
-from src.graph import get_service, run_graph_operation
-from src.llm import LLMUnavailableError
-from src.hooks import is_git_hook_installed, install_hooks
 import structlog
 
 
@@ -49,9 +46,7 @@ def _ensure_project_directory(project_root: Path) -> None:
     Args:
         project_root: Root directory of the project
     """
-    graphiti_dir = project_root / ".graphiti"
-    if not graphiti_dir.exists():
-        graphiti_dir.mkdir(parents=True, exist_ok=True)
+    (project_root / ".graphiti").mkdir(parents=True, exist_ok=True)
 
 
 def _auto_install_hooks(project_root: Path) -> None:
@@ -71,6 +66,8 @@ def _auto_install_hooks(project_root: Path) -> None:
     Args:
         project_root: Root directory of the project
     """
+    from src.hooks import is_git_hook_installed, install_hooks
+
     logger = structlog.get_logger()
 
     try:
@@ -141,6 +138,10 @@ def _add_entity(
     Raises:
         LLMUnavailableError: If LLM is unavailable for entity extraction
     """
+    # Deferred so other commands don't pay for loading the graph stack
+    from src.graph import get_service, run_graph_operation
+    from src.llm import LLMUnavailableError
+
     try:
         # Get service and call add operation
         service = get_service()
@@ -202,7 +203,7 @@ def add_command(
             _auto_install_hooks(root)
 
         # 5. Add entity with spinner
-        with console.status("Adding to knowledge graph..."):
+        with maybe_status("Adding to knowledge graph..."):
             result = _add_entity(
                 content=resolved_content,
                 scope=scope,
@@ -7,10 +7,8 @@ import typer
 from typing import Annotated, Optional
 from pathlib import Path
 
-from src.cli.output import console, print_success, print_json, print_error
+from src.cli.output import console, print_success, print_json, print_error, maybe_status
 from src.cli.utils import EXIT_SUCCESS, EXIT_ERROR
-from src.graph import run_graph_operation
-from src.llm import LLMUnavailableError
 
 
 def capture_command(
@@ -32,6 +30,10 @@ def capture_command(
         graphiti capture                          # Manual capture of current session
         graphiti capture --auto --transcript-path /path/to/transcript --session-id abc123
     """
+    # Deferred so other commands don't pay for loading the graph stack
+    from src.graph import run_graph_operation
+    from src.llm import LLMUnavailableError
+
     try:
         # Import capture functions here to avoid circular imports
         from src.capture.conversation import capture_conversation, capture_manual
@@ -75,7 +77,7 @@ def capture_command(
             transcript = Path(transcript_path) if transcript_path else None
 
             # Show progress spinner during capture
-            with console.status("Capturing conversation knowledge..."):
+            with maybe_status("Capturing conversation knowledge..."):
                 result = run_graph_operation(capture_manual(transcript))
 
             # Output result
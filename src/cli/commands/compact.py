@@ -4,40 +4,148 @@ Merges and deduplicates graph content, rebuilding indexes for optimal performanc
 This is a destructive operation that requires confirmation.
 """
 import typer
-from typing import Annotated, Optional
+from contextlib import contextmanager
+from typing import Annotated, Callable, Optional
 from pathlib import Path
 
 from src.models import GraphScope
+from src.cli.cache import get_cached_stats, invalidate_stats, set_cached_stats
 from src.cli.output import console, print_error, print_json, print_success
 from src.cli.utils import resolve_scope, confirm_action, EXIT_ERROR
-from src.graph import get_service, run_graph_operation
 
+# Bytes -> MB multiplier
+_INV_MB = 1 / (1024 * 1024)
 
-def _get_graph_stats(scope: GraphScope, project_root: Optional[Path] = None) -> dict:
+# Output templates, filled with str.format_map
+_HEADER_TEMPLATE = (
+    "\n[cyan]Knowledge graph:[/cyan] "
+    "{entity_count} entities, "
+    "{relationship_count} relationships, "
+    "~{duplicate_count} potential duplicates\n"
+)
+_SIZE_TEMPLATE = "\n[dim]Size: {old_mb:.1f}MB → {new_mb:.1f}MB ({pct:.1f}% reduction)[/dim]"
+
+
+def _get_graph_stats(
+    scope: GraphScope,
+    project_root: Optional[Path] = None,
+    use_cache: bool = True,
+) -> dict:
     """Get current graph statistics.
 
+    Stats are served from the on-disk cache when the database files have not
+    changed since they were last computed.
+
     Args:
         scope: Graph scope to query
         project_root: Project root path (required for PROJECT scope)
+        use_cache: Whether to consult and populate the stats cache
 
     Returns:
         Dictionary with entity_count, relationship_count, duplicate_count, size_bytes
     """
+    if use_cache:
+        cached = get_cached_stats(scope, project_root)
+        if cached is not None:
+            return cached
+
+    # Deferred: src.graph pulls in graphiti_core and is only needed on a cache miss
+    from src.graph import get_service, run_graph_operation
+
     stats = run_graph_operation(get_service().get_stats(scope=scope, project_root=project_root))
+
+    if use_cache:
+        set_cached_stats(scope, project_root, stats)
     return stats
 
 
-def _compact_graph(scope: GraphScope, project_root: Optional[Path] = None) -> dict:
+def _has_duplicates(
+    scope: GraphScope,
+    project_root: Optional[Path] = None,
+    use_cache: bool = True,
+) -> bool:
+    """Check whether compaction has anything to do.
+
+    Answers from cached stats when available, otherwise asks the service for
+    a cheap duplicate probe instead of computing full statistics.
+
+    Args:
+        scope: Graph scope to check
+        project_root: Project root path (required for PROJECT scope)
+        use_cache: Whether to consult the stats cache
+
+    Returns:
+        True if the graph contains duplicate entities
+    """
+    if use_cache:
+        cached = get_cached_stats(scope, project_root)
+        if cached is not None:
+            return cached["duplicate_count"] > 0
+
+    from src.graph import get_service, run_graph_operation
+
+    return run_graph_operation(
+        get_service().has_duplicates(scope=scope, project_root=project_root)
+    )
+
+
+@contextmanager
+def _maybe_progress(description: str, enabled: bool = True):
+    """Show a transient Rich progress bar, or nothing when it would not be seen.
+
+    Like maybe_status, the bar is skipped when stdout is not a terminal;
+    callers also pass enabled=False for --quiet and JSON output.
+
+    Args:
+        description: Initial task description
+        enabled: Whether the caller wants progress shown at all
+
+    Yields:
+        Callback taking a stage description and completion fraction, or None
+        when no bar is shown
+    """
+    if not (enabled and console.is_terminal):
+        yield None
+        return
+
+    # Deferred: rich.progress is only needed when a bar is actually drawn
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task(description, total=1.0)
+
+        def _on_progress(stage: str, fraction: float) -> None:
+            progress.update(task, description=stage, completed=fraction)
+
+        yield _on_progress
+
+
+def _compact_graph(
+    scope: GraphScope,
+    project_root: Optional[Path] = None,
+    progress: Optional[Callable[[str, float], None]] = None,
+) -> dict:
     """Perform graph compaction operation.
 
     Args:
         scope: Graph scope to compact
         project_root: Project root path (required for PROJECT scope)
+        progress: Optional callback receiving stage descriptions and completion fraction
 
     Returns:
         Dictionary with merged_count, removed_count, new_entity_count, new_size_bytes
     """
-    result = run_graph_operation(get_service().compact(scope=scope, project_root=project_root))
+    from src.graph import get_service, run_graph_operation
+
+    result = run_graph_operation(
+        get_service().compact(scope=scope, project_root=project_root, progress=progress)
+    )
+    invalidate_stats(scope, project_root)
     return result
 
 
@@ -62,6 +170,10 @@ def compact_command(
         bool,
         typer.Option("--quiet", "-q", help="Suppress non-essential output")
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Recompute graph statistics instead of using the cache")
+    ] = False,
 ):
     """Compact the knowledge graph by merging duplicate entities.
 
@@ -82,22 +194,17 @@ def compact_command(
         # Resolve scope
         scope, project_root = resolve_scope(global_scope, project_scope)
 
+        # Check if compaction needed before paying for full statistics
+        if not _has_duplicates(scope, project_root, use_cache=not no_cache):
+            print_success("No compaction needed. Graph is clean.")
+            raise typer.Exit(0)
+
         # Load current graph statistics
-        stats = _get_graph_stats(scope, project_root)
+        stats = _get_graph_stats(scope, project_root, use_cache=not no_cache)
 
         # Display current state
         if not quiet and format != "json":
-            console.print(
-                f"\n[cyan]Knowledge graph:[/cyan] "
-                f"{stats['entity_count']} entities, "
-                f"{stats['relationship_count']} relationships, "
-                f"~{stats['duplicate_count']} potential duplicates\n"
-            )
-
-        # Check if compaction needed
-        if stats["duplicate_count"] == 0:
-            print_success("No compaction needed. Graph is clean.")
-            raise typer.Exit(0)
+            console.print(_HEADER_TEMPLATE.format_map(stats))
 
         # Confirmation for destructive operation
         confirmed = confirm_action(
@@ -109,14 +216,12 @@ def compact_command(
             console.print("Cancelled")
             raise typer.Exit(0)
 
-        # Perform compaction with spinner and progress updates
-        with console.status("Compacting knowledge graph...") as status:
-            status.update("Merging duplicates...")
-            status.update("Rebuilding indexes...")
-            status.update("Finalizing...")
-
-            # Execute compaction
-            result = _compact_graph(scope, project_root)
+        # Perform compaction, advancing the progress bar as the service
+        # reports each stage
+        with _maybe_progress(
+            "Compacting knowledge graph...", enabled=not (quiet or format == "json")
+        ) as on_progress:
+            result = _compact_graph(scope, project_root, progress=on_progress)
 
         # Output results
         if format == "json":
@@ -131,14 +236,13 @@ def compact_command(
 
             if not quiet:
                 # Show size reduction
-                old_size_mb = stats['size_bytes'] / (1024 * 1024)
-                new_size_mb = result['new_size_bytes'] / (1024 * 1024)
-                reduction_pct = ((stats['size_bytes'] - result['new_size_bytes']) / stats['size_bytes']) * 100
-
-                console.print(
-                    f"\n[dim]Size: {old_size_mb:.1f}MB → {new_size_mb:.1f}MB "
-                    f"({reduction_pct:.1f}% reduction)[/dim]"
-                )
+                old_size = stats['size_bytes']
+                new_size = result['new_size_bytes']
+                console.print(_SIZE_TEMPLATE.format_map({
+                    "old_mb": old_size * _INV_MB,
+                    "new_mb": new_size * _INV_MB,
+                    "pct": (1 - new_size / old_size) * 100 if old_size else 0.0,
+                }))
 
     except Exception as e:
         print_error(f"Failed to compact graph: {str(e)}")
@@ -1,18 +1,20 @@
 """Config command for viewing and modifying LLM configuration."""
+import copy
+import json
 import sys
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated, Optional
 
-import tomllib
 import typer
-from rich.table import Table
 
 from src.cli.output import console, print_error, print_json, print_success
 from src.cli.utils import EXIT_BAD_ARGS, EXIT_SUCCESS
-from src.llm.config import load_config
+from src.llm.config import load_config, read_config_toml
 
 # Mapping of valid config keys to their types and descriptions
-VALID_CONFIG_KEYS = {
+_VALID_CONFIG_KEYS = {
     "cloud.endpoint": {"type": str, "desc": "Cloud Ollama endpoint URL"},
     "cloud.api_key": {"type": str, "desc": "Cloud Ollama API key", "sensitive": True},
     "local.endpoint": {"type": str, "desc": "Local Ollama endpoint URL"},
@@ -30,51 +32,101 @@ VALID_CONFIG_KEYS = {
     "reranking.backend": {"type": str, "desc": "Reranking backend (none, bge, openai)"},
 }
 
+# Read-only view with interned keys; the lookup tables below are derived
+# from it and must not drift
+VALID_CONFIG_KEYS = MappingProxyType(
+    {sys.intern(key): info for key, info in _VALID_CONFIG_KEYS.items()}
+)
+
+# LLMConfig attribute for each config key: dots become underscores, except
+# where the attribute name differs from the TOML layout
+_ATTR_MAP = {key: key.replace(".", "_") for key in VALID_CONFIG_KEYS} | {
+    "timeout.request_seconds": "request_timeout_seconds",
+    "quota.rate_limit_cooldown_seconds": "rate_limit_cooldown_seconds",
+}
+
+# (key, (section, name), LLMConfig getter, description, sensitive) per
+# config key, in display order
+_ROWS_SPEC = tuple(
+    (
+        key,
+        tuple(key.split(".")),
+        attrgetter(_ATTR_MAP[key]),
+        info["desc"],
+        info.get("sensitive", False),
+    )
+    for key, info in VALID_CONFIG_KEYS.items()
+)
+
 
 def _get_config_path() -> Path:
     """Get the path to the LLM config file."""
     return Path.home() / ".graphiti" / "llm.toml"
 
 
-def _get_nested_value(config_dict: dict, key_path: str):
-    """Get value from nested dict using dotted key path.
+def _make_getter(section: str, name: str):
+    """Build a reader for one "section.name" config key.
 
     Args:
-        config_dict: Nested dictionary to query
-        key_path: Dotted key path (e.g., "cloud.endpoint")
+        section: TOML table name (e.g., "cloud")
+        name: Key within the table (e.g., "endpoint")
 
     Returns:
-        Value at key path, or None if not found
+        Function taking the parsed TOML dict and returning the value, or None
     """
-    parts = key_path.split(".")
-    value = config_dict
-    for part in parts:
-        if isinstance(value, dict):
-            value = value.get(part)
-        else:
-            return None
-    return value
+    def getter(config_dict: dict):
+        table = config_dict.get(section)
+        return table.get(name) if isinstance(table, dict) else None
+    return getter
 
 
-def _set_nested_value(config_dict: dict, key_path: str, value):
-    """Set value in nested dict using dotted key path.
+def _make_setter(section: str, name: str):
+    """Build a writer for one "section.name" config key.
 
     Args:
-        config_dict: Nested dictionary to modify
-        key_path: Dotted key path (e.g., "cloud.endpoint")
-        value: Value to set
+        section: TOML table name (e.g., "cloud")
+        name: Key within the table (e.g., "endpoint")
+
+    Returns:
+        Function taking the TOML dict and a value, creating the table if needed
     """
-    parts = key_path.split(".")
-    current = config_dict
+    def setter(config_dict: dict, value) -> None:
+        config_dict.setdefault(section, {})[name] = value
+    return setter
+
+
+# Accessors into the raw TOML dict, one per valid key
+_GETTERS = {key: _make_getter(*parts) for key, parts, *_ in _ROWS_SPEC}
+_SETTERS = {key: _make_setter(*parts) for key, parts, *_ in _ROWS_SPEC}
+
 
-    # Navigate/create nested structure
-    for part in parts[:-1]:
-        if part not in current:
-            current[part] = {}
-        current = current[part]
+_BOOL_TRUE = frozenset(("true", "1", "yes"))
+_BOOL_FALSE = frozenset(("false", "0", "no"))
 
-    # Set final value
-    current[parts[-1]] = value
+
+def _parse_bool(value_str: str) -> bool:
+    """Parse a boolean config value (true/false, 1/0, yes/no)."""
+    lower = value_str.lower()
+    if lower in _BOOL_TRUE:
+        return True
+    if lower in _BOOL_FALSE:
+        return False
+    raise ValueError(f"Invalid boolean value: {value_str}")
+
+
+def _parse_list(value_str: str) -> list[str]:
+    """Parse a comma-separated config value."""
+    return [v.strip() for v in value_str.split(",")]
+
+
+# Parser for each supported config value type
+_PARSERS = {
+    str: str,
+    int: int,
+    float: float,
+    bool: _parse_bool,
+    list: _parse_list,
+}
 
 
 def _parse_value(value_str: str, target_type: type):
@@ -90,25 +142,11 @@ def _parse_value(value_str: str, target_type: type):
     Raises:
         ValueError: If parsing fails
     """
-    if target_type == str:
-        return value_str
-    elif target_type == int:
-        return int(value_str)
-    elif target_type == float:
-        return float(value_str)
-    elif target_type == bool:
-        lower = value_str.lower()
-        if lower in ("true", "1", "yes"):
-            return True
-        elif lower in ("false", "0", "no"):
-            return False
-        else:
-            raise ValueError(f"Invalid boolean value: {value_str}")
-    elif target_type == list:
-        # Parse comma-separated values
-        return [v.strip() for v in value_str.split(",")]
-    else:
-        raise ValueError(f"Unsupported type: {target_type}")
+    try:
+        parser = _PARSERS[target_type]
+    except KeyError:
+        raise ValueError(f"Unsupported type: {target_type}") from None
+    return parser(value_str)
 
 
 def _format_toml_value(value) -> str:
@@ -123,8 +161,9 @@ def _format_toml_value(value) -> str:
     if isinstance(value, bool):
         return "true" if value else "false"
     elif isinstance(value, str):
-        # Quote strings
-        return f'"{value}"'
+        # JSON string escapes are valid TOML basic-string escapes; TOML
+        # additionally requires DEL to be escaped
+        return json.dumps(value, ensure_ascii=False).replace("\x7f", "\\u007f")
     elif isinstance(value, list):
         # Format as array
         formatted_items = [_format_toml_value(item) for item in value]
@@ -136,7 +175,9 @@ def _format_toml_value(value) -> str:
 def _write_toml(config_dict: dict, path: Path):
     """Write config dict to TOML file.
 
-    Uses simple TOML formatting for flat nested structure.
+    Uses simple TOML formatting for flat nested structure. Writes to a
+    temporary file and renames it over the target with Path.replace() so an
+    interrupted write never leaves a truncated config behind.
 
     Args:
         config_dict: Configuration dictionary to write
@@ -153,7 +194,13 @@ def _write_toml(config_dict: dict, path: Path):
                 lines.append(f"{key} = {_format_toml_value(value)}")
         lines.append("")  # Blank line between sections
 
-    path.write_text("\n".join(lines))
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        tmp_path.write_text("\n".join(lines), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def config_command(
@@ -178,11 +225,8 @@ def config_command(
     config = load_config()
     config_path = _get_config_path()
 
-    # Load existing TOML file for modifications
-    existing_toml = {}
-    if config_path.exists():
-        with open(config_path, "rb") as f:
-            existing_toml = tomllib.load(f)
+    # Load existing TOML file (parsed once per process while unchanged)
+    existing_toml = read_config_toml(config_path)
 
     # Handle --set flag
     if set_value:
@@ -194,7 +238,7 @@ def config_command(
             sys.exit(EXIT_BAD_ARGS)
 
         key, value_str = set_value.split("=", 1)
-        key = key.strip()
+        key = sys.intern(key.strip())
         value_str = value_str.strip()
 
         # Validate key
@@ -216,8 +260,9 @@ def config_command(
             )
             sys.exit(EXIT_BAD_ARGS)
 
-        # Update config dict
-        _set_nested_value(existing_toml, key, parsed_value)
+        # Update a private copy; the parsed dict is shared with the cache
+        existing_toml = copy.deepcopy(existing_toml)
+        _SETTERS[key](existing_toml, parsed_value)
 
         # Write back to file
         _write_toml(existing_toml, config_path)
@@ -227,6 +272,7 @@ def config_command(
 
     # Handle --get flag
     if get_key:
+        get_key = sys.intern(get_key)
         if get_key not in VALID_CONFIG_KEYS:
             print_error(
                 f"Unknown config key '{get_key}'.",
@@ -235,30 +281,10 @@ def config_command(
             sys.exit(EXIT_BAD_ARGS)
 
         # Get value from loaded config
-        value = _get_nested_value(existing_toml, get_key)
+        value = _GETTERS[get_key](existing_toml)
         if value is None:
             # Fall back to default from loaded config object
-            # Map dotted key to config attribute
-            attr_map = {
-                "cloud.endpoint": "cloud_endpoint",
-                "cloud.api_key": "cloud_api_key",
-                "local.endpoint": "local_endpoint",
-                "local.auto_start": "local_auto_start",
-                "local.models": "local_models",
-                "embeddings.models": "embeddings_models",
-                "retry.max_attempts": "retry_max_attempts",
-                "retry.delay_seconds": "retry_delay_seconds",
-                "timeout.request_seconds": "request_timeout_seconds",
-                "quota.warning_threshold": "quota_warning_threshold",
-                "quota.rate_limit_cooldown_seconds": "rate_limit_cooldown_seconds",
-                "queue.max_size": "queue_max_size",
-                "queue.item_ttl_hours": "queue_item_ttl_hours",
-                "reranking.enabled": "reranking_enabled",
-                "reranking.backend": "reranking_backend",
-            }
-            attr_name = attr_map.get(get_key)
-            if attr_name:
-                value = getattr(config, attr_name, None)
+            value = getattr(config, _ATTR_MAP[get_key], None)
 
         if format == "json":
             print_json({get_key: value})
@@ -270,42 +296,14 @@ def config_command(
     # Show all settings (default behavior)
     if format == "json":
         # Build JSON structure from config object
-        config_data = {
-            "cloud": {
-                "endpoint": config.cloud_endpoint,
-                "api_key": config.cloud_api_key,
-            },
-            "local": {
-                "endpoint": config.local_endpoint,
-                "auto_start": config.local_auto_start,
-                "models": config.local_models,
-            },
-            "embeddings": {
-                "models": config.embeddings_models,
-            },
-            "retry": {
-                "max_attempts": config.retry_max_attempts,
-                "delay_seconds": config.retry_delay_seconds,
-            },
-            "timeout": {
-                "request_seconds": config.request_timeout_seconds,
-            },
-            "quota": {
-                "warning_threshold": config.quota_warning_threshold,
-                "rate_limit_cooldown_seconds": config.rate_limit_cooldown_seconds,
-            },
-            "queue": {
-                "max_size": config.queue_max_size,
-                "item_ttl_hours": config.queue_item_ttl_hours,
-            },
-            "reranking": {
-                "enabled": config.reranking_enabled,
-                "backend": config.reranking_backend,
-            },
-        }
+        config_data = {}
+        for _key, (section, name), getter, _desc, _sensitive in _ROWS_SPEC:
+            config_data.setdefault(section, {})[name] = getter(config)
         print_json(config_data)
     else:
         # Display as Rich table
+        from rich.table import Table
+
         table = Table(
             title="LLM Configuration",
             show_header=True,
@@ -315,28 +313,15 @@ def config_command(
         table.add_column("Value", style="white")
         table.add_column("Description", style="dim")
 
-        # Build rows from config object
-        rows = [
-            ("cloud.endpoint", config.cloud_endpoint),
-            ("cloud.api_key", "***" if config.cloud_api_key else "(not set)"),
-            ("local.endpoint", config.local_endpoint),
-            ("local.auto_start", str(config.local_auto_start)),
-            ("local.models", ", ".join(config.local_models)),
-            ("embeddings.models", ", ".join(config.embeddings_models)),
-            ("retry.max_attempts", str(config.retry_max_attempts)),
-            ("retry.delay_seconds", str(config.retry_delay_seconds)),
-            ("timeout.request_seconds", str(config.request_timeout_seconds)),
-            ("quota.warning_threshold", str(config.quota_warning_threshold)),
-            ("quota.rate_limit_cooldown_seconds", str(config.rate_limit_cooldown_seconds)),
-            ("queue.max_size", str(config.queue_max_size)),
-            ("queue.item_ttl_hours", str(config.queue_item_ttl_hours)),
-            ("reranking.enabled", str(config.reranking_enabled)),
-            ("reranking.backend", config.reranking_backend),
-        ]
-
-        for key, value in rows:
-            desc = VALID_CONFIG_KEYS.get(key, {}).get("desc", "")
-            table.add_row(key, value, desc)
+        for key, _parts, getter, desc, sensitive in _ROWS_SPEC:
+            value = getter(config)
+            if sensitive:
+                display = "***" if value else "(not set)"
+            elif isinstance(value, list):
+                display = ", ".join(value)
+            else:
+                display = str(value)
+            table.add_row(key, display, desc)
 
         console.print(table)
 
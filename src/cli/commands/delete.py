@@ -3,44 +3,52 @@
 Provides bulk entity deletion with confirmation prompts, ambiguous name
 resolution, and JSON/quiet output modes.
 """
+from contextlib import nullcontext
+from operator import itemgetter
 from typing import Annotated, Optional
 from pathlib import Path
 import typer
-from rich.table import Table
-from src.cli.output import console, print_json, print_error, print_success
+from src.cli.output import console, print_json, print_error, print_success, maybe_status
 from src.cli.utils import resolve_scope, confirm_action, EXIT_ERROR, EXIT_SUCCESS
-from src.graph import get_service, run_graph_operation
 from src.models import GraphScope
 
 
-def _resolve_entity(name: str, scope: GraphScope, project_root: Optional[Path] = None) -> dict | list[dict] | None:
-    """Resolve entity name to entity object from the knowledge graph.
+def _resolve_entities(
+    names: list[str], scope: GraphScope, project_root: Optional[Path] = None
+) -> dict[str, dict | list[dict] | None]:
+    """Resolve entity names to entity objects from the knowledge graph.
+
+    All names are resolved in a single graph operation.
 
     Args:
-        name: Entity name or ID to resolve
+        names: Entity names or IDs to resolve
         scope: Graph scope (GLOBAL or PROJECT)
         project_root: Project root path (required for PROJECT scope)
 
     Returns:
-        Entity dict if unique match, list of matches if ambiguous, None if not found
+        Mapping of each name to its entity dict if unique match, list of
+        matches if ambiguous, None if not found
     """
-    result = run_graph_operation(get_service().get_entity(name=name, scope=scope, project_root=project_root))
-    return result
+    # Deferred so other commands don't pay for loading the graph stack
+    from src.graph import get_service, run_graph_operation
+
+    return run_graph_operation(
+        get_service().get_entities(names=names, scope=scope, project_root=project_root)
+    )
 
 
-def _delete_entities(entities: list[dict], scope: GraphScope, project_root: Optional[Path] = None) -> int:
+def _delete_entities(names: list[str], scope: GraphScope, project_root: Optional[Path] = None) -> int:
     """Delete entities from the graph.
 
     Args:
-        entities: List of entity dicts to delete
+        names: Names of the entities to delete
         scope: Graph scope (GLOBAL or PROJECT)
         project_root: Project root path (required for PROJECT scope)
 
     Returns:
         Count of entities successfully deleted
     """
-    # Extract entity names from the entities list
-    names = [e["name"] for e in entities]
+    from src.graph import get_service, run_graph_operation
 
     # Call GraphService to delete the entities
     deleted_count = run_graph_operation(get_service().delete_entities(names=names, scope=scope, project_root=project_root))
@@ -65,9 +73,10 @@ def delete_command(
     scope, project_root = resolve_scope(global_scope, project_scope)
 
     # Resolve all entity names to actual entities
+    results = _resolve_entities(entities, scope, project_root)
     resolved_entities = []
     for entity_name in entities:
-        result = _resolve_entity(entity_name, scope, project_root)
+        result = results[entity_name]
 
         # Handle not found
         if result is None:
@@ -85,13 +94,13 @@ def delete_command(
             for idx, match in enumerate(result, 1):
                 console.print(f"  {idx}. [cyan]{match['name']}[/cyan] ({match['type']}) - ID: {match['id']}")
 
-            # Prompt user to choose
-            choice = typer.prompt(f"\nSelect entity [1-{len(result)}]", type=int)
-
-            # Validate choice
-            if choice < 1 or choice > len(result):
+            # Prompt until the choice is in range, so a typo does not force
+            # re-running the command and re-resolving every name
+            while True:
+                choice = typer.prompt(f"\nSelect entity [1-{len(result)}]", type=int)
+                if 1 <= choice <= len(result):
+                    break
                 print_error(f"Invalid selection: {choice}")
-                raise typer.Exit(EXIT_ERROR)
 
             # Use selected entity
             resolved_entities.append(result[choice - 1])
@@ -104,6 +113,8 @@ def delete_command(
         console.print("\n[yellow]The following entities will be deleted:[/yellow]\n")
 
         # Create table
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold cyan")
         table.add_column("Name", style="cyan")
         table.add_column("Type", style="magenta")
@@ -120,13 +131,17 @@ def delete_command(
             console.print("[dim]Cancelled[/dim]")
             raise typer.Exit(EXIT_SUCCESS)
 
-    # Delete entities with spinner
-    with console.status(f"[cyan]Deleting {len(resolved_entities)} entities...", spinner="dots"):
-        deleted_count = _delete_entities(resolved_entities, scope, project_root)
+    entity_names = list(map(itemgetter("name"), resolved_entities))
 
-    # Output results
-    entity_names = [e["name"] for e in resolved_entities]
+    # Delete entities, with a spinner only when output is for a human
+    with (
+        maybe_status(f"[cyan]Deleting {len(entity_names)} entities...", spinner="dots")
+        if not (quiet or format == "json")
+        else nullcontext()
+    ):
+        deleted_count = _delete_entities(entity_names, scope, project_root)
 
+    # Output results
     if format == "json":
         print_json({
             "deleted": deleted_count,
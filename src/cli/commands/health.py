@@ -1,97 +1,234 @@
 """Health check command for system diagnostics."""
+import asyncio
+import os
 import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Annotated, Optional
 
-import httpx
 import typer
-from rich.table import Table
 
+from src.cli.cache import get_cached_health, set_cached_health
 from src.cli.output import console, print_json
 from src.cli.utils import EXIT_ERROR, EXIT_SUCCESS
 from src.config.paths import GLOBAL_DB_DIR, get_project_db_path
-from src.llm import get_client, load_config
 from src.storage import GraphSelector
 
+# How long a passing check result is reused, in seconds
+_OLLAMA_TTL = 30
+_QUOTA_TTL = 30
+_DATABASE_TTL = 300
+
+# Stop sizing the database directory past these limits; the health table
+# only needs a rough figure and the walk is O(files) otherwise
+_DB_SIZE_CEILING = 10 * 1024 ** 3
+_DB_FILE_CEILING = 50_000
+
+# Fail fast on unreachable endpoints: connecting covers TCP + TLS, reading
+# only waits for the status line of a bodiless HEAD response
+_CLOUD_TIMEOUTS = {"connect": 1.0, "read": 2.0, "write": 1.0, "pool": 0.5}
+
+# Map status to visual symbols and colors
+_STATUS_ICONS = {
+    "ok": "[green]✓[/green]",
+    "warning": "[yellow]⚠[/yellow]",
+    "error": "[red]✗[/red]",
+}
+
+# (header, style) for each column of the health table
+_TABLE_COLUMNS = (
+    ("Component", "cyan"),
+    ("Status", "white"),
+    ("Detail", "dim"),
+)
+
+
+@dataclass(slots=True)
+class HealthCheck:
+    """Result of a single health check.
+
+    Attributes:
+        name: Component name shown in the table
+        status: "ok", "warning" or "error"
+        detail: One-line summary
+        extras: Additional data for verbose and JSON output
+            (e.g. models, path, size_mb, usage figures, error)
+    """
+    name: str
+    status: str
+    detail: str
+    extras: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Flatten into the dict shape used for JSON output and the cache."""
+        return {"name": self.name, "status": self.status, "detail": self.detail, **self.extras}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HealthCheck":
+        """Rebuild a result from its to_dict() form."""
+        extras = {k: v for k, v in data.items() if k not in ("name", "status", "detail")}
+        return cls(name=data["name"], status=data["status"], detail=data["detail"], extras=extras)
+
 
-def _check_ollama_cloud() -> dict:
+async def _check_ollama_cloud() -> HealthCheck:
     """Check cloud Ollama connectivity.
 
     Returns:
-        Dict with name, status, detail keys
+        HealthCheck result
     """
+    # Deferred: only health checks need the HTTP client and LLM config
+    import httpx
+    from src.llm import load_config
+
     config = load_config()
 
     # Check if API key is configured
     if not config.cloud_api_key:
-        return {
-            "name": "Cloud Ollama",
-            "status": "warning",
-            "detail": "No API key configured. Set OLLAMA_API_KEY environment variable.",
-        }
+        return HealthCheck(
+            name="Cloud Ollama",
+            status="warning",
+            detail="No API key configured. Set OLLAMA_API_KEY environment variable.",
+        )
 
     # Try to ping cloud endpoint
     try:
-        headers = {"Authorization": f"Bearer {config.cloud_api_key}"}
-        response = httpx.get(
-            f"{config.cloud_endpoint}/api/tags",
-            headers=headers,
-            timeout=5.0
-        )
-        if response.status_code == 200:
-            return {
-                "name": "Cloud Ollama",
-                "status": "ok",
-                "detail": f"Connected to {config.cloud_endpoint}",
-            }
+        # One client per run so the GET fallback reuses the HEAD's connection
+        async with httpx.AsyncClient(
+            base_url=config.cloud_endpoint,
+            headers={"Authorization": f"Bearer {config.cloud_api_key}"},
+            timeout=httpx.Timeout(**_CLOUD_TIMEOUTS),
+        ) as http:
+            response = await http.head("/api/tags")
+            if response.status_code == 405:
+                # Endpoint does not accept HEAD; fall back to GET
+                response = await http.get("/api/tags")
+
+        if response.is_success:
+            return HealthCheck(
+                name="Cloud Ollama",
+                status="ok",
+                detail=f"Connected to {config.cloud_endpoint}",
+            )
+        elif response.status_code in (401, 403):
+            return HealthCheck(
+                name="Cloud Ollama",
+                status="error",
+                detail=f"Reachable, but API key rejected (HTTP {response.status_code}). Check OLLAMA_API_KEY.",
+            )
         else:
-            return {
-                "name": "Cloud Ollama",
-                "status": "error",
-                "detail": f"HTTP {response.status_code}. Check OLLAMA_API_KEY.",
-            }
+            return HealthCheck(
+                name="Cloud Ollama",
+                status="error",
+                detail=f"HTTP {response.status_code}. Check OLLAMA_API_KEY.",
+            )
+    except httpx.ConnectTimeout:
+        return HealthCheck(
+            name="Cloud Ollama",
+            status="error",
+            detail=f"Timed out connecting to {config.cloud_endpoint}.",
+        )
+    except httpx.ReadTimeout:
+        return HealthCheck(
+            name="Cloud Ollama",
+            status="error",
+            detail=f"Connected to {config.cloud_endpoint}, but it timed out responding.",
+        )
     except Exception as e:
-        return {
-            "name": "Cloud Ollama",
-            "status": "error",
-            "detail": f"Connection failed: {str(e)}. Check OLLAMA_API_KEY.",
-        }
+        return HealthCheck(
+            name="Cloud Ollama",
+            status="error",
+            detail=f"Connection failed: {str(e)}. Check OLLAMA_API_KEY.",
+        )
 
 
-def _check_ollama_local() -> dict:
+async def _check_ollama_local(verbose: bool = False) -> HealthCheck:
     """Check local Ollama connectivity.
 
+    Args:
+        verbose: Include the installed model names in the result
+
     Returns:
-        Dict with name, status, detail keys
+        HealthCheck result
     """
+    from src.llm import get_client, load_config
+
     config = load_config()
     client = get_client()
 
     try:
         # Try to list models to verify local Ollama is running
-        models = client.local_client.list()
+        models = await asyncio.to_thread(client.local_client.list)
         model_list = models.get("models", [])
         model_count = len(model_list)
 
-        # Extract model names for verbose output
-        model_names = [m.get("name", "unknown") for m in model_list]
-
-        return {
-            "name": "Local Ollama",
-            "status": "ok",
-            "detail": f"Running at {config.local_endpoint}, {model_count} models available",
-            "models": model_names,  # Extra data for verbose mode
-        }
+        result = HealthCheck(
+            name="Local Ollama",
+            status="ok",
+            detail=f"Running at {config.local_endpoint}, {model_count} models available",
+        )
+        if verbose:
+            # Extract model names for verbose output
+            result.extras["models"] = [m.get("name", "unknown") for m in model_list]
+        return result
     except Exception as e:
-        return {
-            "name": "Local Ollama",
-            "status": "error",
-            "detail": f"Not running. Start with: ollama serve",
-            "error": str(e),  # Extra data for verbose mode
-        }
+        return HealthCheck(
+            name="Local Ollama",
+            status="error",
+            detail=f"Not running. Start with: ollama serve",
+            extras={"error": str(e)},  # Extra data for verbose mode
+        )
+
+
+def _db_dir_stats(
+    db_path: Path,
+    max_bytes: int = _DB_SIZE_CEILING,
+    max_files: int = _DB_FILE_CEILING,
+) -> tuple[int, int, bool]:
+    """Count top-level entries and total file bytes under a database directory.
+
+    The walk stops once either ceiling is passed, so the health check stays
+    fast on very large databases; the size is then a lower bound.
 
+    Args:
+        db_path: Path to database directory
+        max_bytes: Stop after this many bytes have been counted
+        max_files: Stop after this many files have been stat()ed
 
-def _check_database(scope_name: str, db_path: Path) -> dict:
+    Returns:
+        Tuple of (top-level entry count, total size in bytes, truncated)
+    """
+    # Single iterative scandir walk: DirEntry caches the file type from
+    # readdir, so only regular files need a stat() call for their size.
+    # The top-level directory is walked first, giving the entry count.
+    entry_count = 0
+    size_bytes = 0
+    file_count = 0
+    stack = [db_path]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except FileNotFoundError:
+            if path is db_path:
+                raise
+            # Subdirectory removed mid-walk (e.g. by a checkpoint)
+            continue
+        with it:
+            for entry in it:
+                if path is db_path:
+                    entry_count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    size_bytes += entry.stat(follow_symlinks=False).st_size
+                    file_count += 1
+                    if size_bytes > max_bytes or file_count > max_files:
+                        return entry_count, size_bytes, True
+    return entry_count, size_bytes, False
+
+
+async def _check_database(scope_name: str, db_path: Path) -> HealthCheck:
     """Check database status.
 
     Args:
@@ -99,45 +236,54 @@ def _check_database(scope_name: str, db_path: Path) -> dict:
         db_path: Path to database directory
 
     Returns:
-        Dict with name, status, detail keys
+        HealthCheck result
     """
-    if not db_path.exists():
-        return {
-            "name": f"Database ({scope_name})",
-            "status": "warning",
-            "detail": f"Not initialized at {db_path}",
-        }
-
-    # Check if database directory is accessible
+    # Check if database directory is accessible; a missing directory
+    # surfaces from the walk's first scandir rather than an exists() probe
     try:
         # Count files/directories in database (basic health check)
-        contents = list(db_path.iterdir())
-        size_mb = sum(f.stat().st_size for f in db_path.rglob("*") if f.is_file()) / (1024 * 1024)
-
-        return {
-            "name": f"Database ({scope_name})",
-            "status": "ok",
-            "detail": f"Initialized, {len(contents)} entries, {size_mb:.1f} MB",
-            "path": str(db_path),
-            "size_mb": size_mb,
-        }
+        entry_count, size_bytes, truncated = await asyncio.to_thread(_db_dir_stats, db_path)
+        size_mb = size_bytes / (1024 * 1024)
+
+        if truncated:
+            detail = f"Initialized, {entry_count}+ entries, ≥{size_mb:.1f} MB"
+        else:
+            detail = f"Initialized, {entry_count} entries, {size_mb:.1f} MB"
+
+        return HealthCheck(
+            name=f"Database ({scope_name})",
+            status="ok",
+            detail=detail,
+            extras={"path": str(db_path), "size_mb": size_mb},
+        )
+    except FileNotFoundError:
+        return HealthCheck(
+            name=f"Database ({scope_name})",
+            status="warning",
+            detail=f"Not initialized at {db_path}",
+        )
     except Exception as e:
-        return {
-            "name": f"Database ({scope_name})",
-            "status": "error",
-            "detail": f"Access error: {str(e)}",
-        }
+        return HealthCheck(
+            name=f"Database ({scope_name})",
+            status="error",
+            detail=f"Access error: {str(e)}",
+        )
 
 
-def _check_quota() -> dict:
+async def _check_quota(verbose: bool = False) -> HealthCheck:
     """Check LLM quota status.
 
+    Args:
+        verbose: Include raw usage figures in the result
+
     Returns:
-        Dict with name, status, detail keys
+        HealthCheck result
     """
+    from src.llm import get_client
+
     try:
         client = get_client()
-        quota_status = client.get_quota_status()
+        quota_status = await asyncio.to_thread(client.get_quota_status)
 
         usage_pct = quota_status.usage_percent or 0
         limit = quota_status.limit or 0
@@ -155,20 +301,76 @@ def _check_quota() -> dict:
             status = "ok"
             detail = f"{usage_pct:.1f}% used ({used}/{limit})"
 
-        return {
-            "name": "Quota",
-            "status": status,
-            "detail": detail,
-            "usage_percent": usage_pct,
-            "used": used,
-            "limit": limit,
-        }
+        result = HealthCheck(name="Quota", status=status, detail=detail)
+        if verbose:
+            result.extras.update(usage_percent=usage_pct, used=used, limit=limit)
+        return result
     except Exception as e:
-        return {
-            "name": "Quota",
-            "status": "warning",
-            "detail": f"Could not check quota: {str(e)}",
-        }
+        return HealthCheck(
+            name="Quota",
+            status="warning",
+            detail=f"Could not check quota: {str(e)}",
+        )
+
+
+def _make_health_table():
+    """Return an empty health table with its columns configured."""
+    from rich.table import Table
+
+    table = Table(title="System Health", show_header=True, header_style="bold cyan")
+    for header, style in _TABLE_COLUMNS:
+        table.add_column(header, style=style)
+    return table
+
+
+async def _run_checks(
+    project_db_dir: Optional[Path], use_cache: bool = True, verbose: bool = False
+) -> list[HealthCheck]:
+    """Run all health checks concurrently.
+
+    Each check spends its time waiting on network or filesystem I/O, so the
+    total wall time is that of the slowest check rather than their sum.
+    Passing results are cached with a per-check TTL; failures are always
+    re-checked so a fixed problem shows up on the next run.
+
+    Args:
+        project_db_dir: Project database directory, or None outside a project
+        use_cache: Whether to reuse cached results that are within their TTL
+        verbose: Collect the extra per-check details shown in verbose/JSON output
+
+    Returns:
+        Check results in display order
+    """
+    # Verbose results carry extra keys, so they are cached separately
+    suffix = ":verbose" if verbose else ""
+    specs = [
+        ("ollama_cloud", _OLLAMA_TTL, _check_ollama_cloud, ()),
+        ("ollama_local" + suffix, _OLLAMA_TTL, _check_ollama_local, (verbose,)),
+        (f"database:{GLOBAL_DB_DIR}", _DATABASE_TTL, _check_database, ("global", GLOBAL_DB_DIR)),
+    ]
+    if project_db_dir is not None:
+        specs.append(
+            (f"database:{project_db_dir}", _DATABASE_TTL, _check_database, ("project", project_db_dir))
+        )
+    specs.append(("quota" + suffix, _QUOTA_TTL, _check_quota, (verbose,)))
+
+    now = time.time()
+    cached = get_cached_health(now) if use_cache else {}
+    fresh: dict[str, tuple[dict, float]] = {}
+
+    async def run(key: str, ttl: float, check, args: tuple) -> HealthCheck:
+        if key in cached:
+            return HealthCheck.from_dict(cached[key])
+        result = await check(*args)
+        if result.status == "ok":
+            fresh[key] = (result.to_dict(), ttl)
+        return result
+
+    checks = list(await asyncio.gather(*(run(*spec) for spec in specs)))
+
+    if fresh:
+        set_cached_health(fresh, now)
+    return checks
 
 
 def health_command(
@@ -178,6 +380,9 @@ def health_command(
     format: Annotated[
         Optional[str], typer.Option("--format", "-f", help="Output format: json")
     ] = None,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Re-run every check instead of reusing recent results")
+    ] = False,
 ):
     """Check system health and diagnostics.
 
@@ -191,31 +396,21 @@ def health_command(
         graphiti health              # Quick pass/fail summary
         graphiti health --verbose    # Full diagnostic details
         graphiti health --format json  # JSON output
+        graphiti health --no-cache   # Ignore cached results
     """
-    # Run all health checks
-    checks = []
-
-    # Check cloud Ollama
-    checks.append(_check_ollama_cloud())
-
-    # Check local Ollama
-    checks.append(_check_ollama_local())
-
-    # Check global database
-    checks.append(_check_database("global", GLOBAL_DB_DIR))
-
-    # Check project database if in a project
+    # Check project database too if in a project
     project_root = GraphSelector.find_project_root()
-    if project_root:
-        project_db_path = get_project_db_path(project_root)
-        checks.append(_check_database("project", project_db_path.parent))
+    project_db_dir = get_project_db_path(project_root).parent if project_root else None
 
-    # Check quota
-    checks.append(_check_quota())
+    # Run all health checks
+    # JSON output has always carried the verbose-only keys
+    checks = asyncio.run(
+        _run_checks(project_db_dir, use_cache=not no_cache, verbose=verbose or format == "json")
+    )
 
     # Determine overall status
-    has_error = any(c["status"] == "error" for c in checks)
-    has_warning = any(c["status"] == "warning" for c in checks)
+    has_error = any(c.status == "error" for c in checks)
+    has_warning = any(c.status == "warning" for c in checks)
 
     if has_error:
         overall_status = "FAIL"
@@ -231,61 +426,51 @@ def health_command(
     if format == "json":
         print_json({
             "overall": overall_status.lower(),
-            "checks": checks,
+            "checks": [c.to_dict() for c in checks],
         })
         sys.exit(EXIT_SUCCESS if not has_error else EXIT_ERROR)
 
     # Rich table output
-    table = Table(
-        title="System Health",
-        show_header=True,
-        header_style="bold cyan"
-    )
-    table.add_column("Component", style="cyan")
-    table.add_column("Status", style="white")
-    table.add_column("Detail", style="dim")
-
-    # Map status to visual symbols and colors
-    status_icons = {
-        "ok": "[green]✓[/green]",
-        "warning": "[yellow]⚠[/yellow]",
-        "error": "[red]✗[/red]",
-    }
+    table = _make_health_table()
 
     for check in checks:
-        icon = status_icons.get(check["status"], "?")
+        icon = _STATUS_ICONS.get(check.status, "?")
         table.add_row(
-            check["name"],
+            check.name,
             icon,
-            check["detail"]
+            check.detail
         )
 
     console.print(table)
 
     # Verbose mode: show expanded details
     if verbose:
-        console.print("\n[bold]Detailed Information:[/bold]\n")
+        # Collected into one string so Rich renders and writes once
+        lines = ["\n[bold]Detailed Information:[/bold]\n"]
 
         for check in checks:
-            console.print(f"[cyan]{check['name']}[/cyan]")
-            console.print(f"  Status: {status_icons[check['status']]}")
-            console.print(f"  Detail: {check['detail']}")
+            lines.append(f"[cyan]{check.name}[/cyan]")
+            lines.append(f"  Status: {_STATUS_ICONS[check.status]}")
+            lines.append(f"  Detail: {check.detail}")
 
             # Show extra verbose data if available
-            if "models" in check:
-                console.print(f"  Models: {', '.join(check['models'])}")
-            if "path" in check:
-                console.print(f"  Path: {check['path']}")
-            if "size_mb" in check:
-                console.print(f"  Size: {check['size_mb']:.1f} MB")
-            if "usage_percent" in check:
-                console.print(f"  Usage: {check['usage_percent']:.1f}%")
-                console.print(f"  Used: {check['used']}")
-                console.print(f"  Limit: {check['limit']}")
-            if "error" in check:
-                console.print(f"  Error: {check['error']}")
-
-            console.print()
+            extras = check.extras
+            if "models" in extras:
+                lines.append(f"  Models: {', '.join(extras['models'])}")
+            if "path" in extras:
+                lines.append(f"  Path: {extras['path']}")
+            if "size_mb" in extras:
+                lines.append(f"  Size: {extras['size_mb']:.1f} MB")
+            if "usage_percent" in extras:
+                lines.append(f"  Usage: {extras['usage_percent']:.1f}%")
+                lines.append(f"  Used: {extras['used']}")
+                lines.append(f"  Limit: {extras['limit']}")
+            if "error" in extras:
+                lines.append(f"  Error: {extras['error']}")
+
+            lines.append("")
+
+        console.print("\n".join(lines))
 
     # Overall result
     console.print(f"\n[bold]Health: [{overall_color}]{overall_status}[/{overall_color}][/bold]")
@@ -4,31 +4,26 @@ Manages automatic capture hooks for git and Claude Code.
 Provides install, uninstall, and status subcommands.
 """
 import typer
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Optional
 from pathlib import Path
-from rich.table import Table
 
-from src.cli.output import console, print_success, print_json, print_error
+from src.cli.output import console, print_success, print_json, print_error, maybe_status
 from src.cli.utils import resolve_scope, EXIT_SUCCESS, EXIT_ERROR
-from src.hooks import (
-    install_hooks,
-    uninstall_hooks,
-    get_hook_status,
-    set_hooks_enabled,
-    get_hooks_enabled,
-)
-from src.hooks.installer import (
-    install_precommit_hook,
-    uninstall_precommit_hook,
-    is_precommit_hook_installed,
-    install_postcheckout_hook,
-    install_postrewrite_hook,
-    upgrade_postmerge_hook,
-    uninstall_postcheckout_hook,
-    uninstall_postrewrite_hook,
-    is_postcheckout_hook_installed,
-    is_postrewrite_hook_installed,
-)
+
+# Checkmark/X display for the status table
+_INSTALLED_ICONS = {True: "[green]✓[/green]", False: "[red]✗[/red]"}
+
+
+def _make_status_table():
+    """Return an empty hook status table with its columns configured."""
+    from rich.table import Table
+
+    table = Table(title="Hook Status", show_header=True, header_style="bold cyan")
+    table.add_column("Hook Type", style="white")
+    table.add_column("Installed", style="white")
+    return table
+
 
 # Create hooks command group
 hooks_app = typer.Typer(
@@ -58,6 +53,15 @@ def install_command(
         graphiti hooks install --git-only   # Install only git hook
         graphiti hooks install --force      # Reinstall even if present
     """
+    # Deferred: installer modules are only needed when this command runs
+    from src.hooks import install_hooks
+    from src.hooks.installer import (
+        install_postcheckout_hook,
+        install_postrewrite_hook,
+        install_precommit_hook,
+        upgrade_postmerge_hook,
+    )
+
     try:
         # Resolve project root (hooks require project context)
         scope, root = resolve_scope()
@@ -76,23 +80,30 @@ def install_command(
         # Derive .git directory for new hook installer functions
         git_dir = root / ".git"
 
-        # Install hooks
-        with console.status("Installing hooks..."):
-            result = install_hooks(
+        # Install hooks concurrently; each installer writes its own file
+        with maybe_status("Installing hooks..."), ThreadPoolExecutor(max_workers=5) as executor:
+            result_future = executor.submit(
+                install_hooks,
                 root,
                 install_git=install_git,
                 install_claude=install_claude
             )
 
             # Upgrade post-merge hook if it's the old Phase 7 journal-based one
-            upgrade_postmerge_hook(git_dir)
+            postmerge_future = executor.submit(upgrade_postmerge_hook, git_dir)
 
             # Install pre-commit hook (secret scanning + size checks)
-            precommit_installed = install_precommit_hook(root, force=force)
+            precommit_future = executor.submit(install_precommit_hook, root, force=force)
 
             # Install indexer trigger hooks (post-checkout and post-rewrite)
-            postcheckout_installed = install_postcheckout_hook(git_dir)
-            postrewrite_installed = install_postrewrite_hook(git_dir)
+            postcheckout_future = executor.submit(install_postcheckout_hook, git_dir)
+            postrewrite_future = executor.submit(install_postrewrite_hook, git_dir)
+
+            result = result_future.result()
+            postmerge_future.result()
+            precommit_installed = precommit_future.result()
+            postcheckout_installed = postcheckout_future.result()
+            postrewrite_installed = postrewrite_future.result()
 
         # Output result
         if format == "json":
@@ -170,6 +181,13 @@ def uninstall_command(
         graphiti hooks uninstall              # Remove both hook types
         graphiti hooks uninstall --git-only   # Remove only git hook
     """
+    from src.hooks import uninstall_hooks
+    from src.hooks.installer import (
+        uninstall_postcheckout_hook,
+        uninstall_postrewrite_hook,
+        uninstall_precommit_hook,
+    )
+
     try:
         # Resolve project root
         scope, root = resolve_scope()
@@ -188,18 +206,24 @@ def uninstall_command(
         # Derive .git directory for new hook installer functions
         git_dir = root / ".git"
 
-        # Uninstall hooks
-        with console.status("Removing hooks..."):
-            result = uninstall_hooks(
+        # Uninstall hooks concurrently; each uninstaller edits its own file
+        with maybe_status("Removing hooks..."), ThreadPoolExecutor(max_workers=4) as executor:
+            result_future = executor.submit(
+                uninstall_hooks,
                 root,
                 remove_git=remove_git,
                 remove_claude=remove_claude
             )
 
             # Also remove pre-commit, post-checkout, and post-rewrite hooks
-            precommit_removed = uninstall_precommit_hook(root)
-            postcheckout_removed = uninstall_postcheckout_hook(git_dir)
-            postrewrite_removed = uninstall_postrewrite_hook(git_dir)
+            precommit_future = executor.submit(uninstall_precommit_hook, root)
+            postcheckout_future = executor.submit(uninstall_postcheckout_hook, git_dir)
+            postrewrite_future = executor.submit(uninstall_postrewrite_hook, git_dir)
+
+            result = result_future.result()
+            precommit_removed = precommit_future.result()
+            postcheckout_removed = postcheckout_future.result()
+            postrewrite_removed = postrewrite_future.result()
 
         # Output result
         if format == "json":
@@ -246,6 +270,8 @@ def status_command(
         graphiti hooks status              # Show status table
         graphiti hooks status --format json  # JSON output
     """
+    from src.hooks import get_hook_status
+
     try:
         # Resolve project root
         scope, root = resolve_scope()
@@ -257,14 +283,12 @@ def status_command(
             )
             raise typer.Exit(EXIT_ERROR)
 
-        # Get hook status
+        # Get hook status; git hooks come from a single .git/hooks listing
         status = get_hook_status(root)
-
-        # Derive .git directory for new hook status checks
-        git_dir = root / ".git"
-        precommit_installed = is_precommit_hook_installed(root)
-        postcheckout_installed = is_postcheckout_hook_installed(git_dir)
-        postrewrite_installed = is_postrewrite_hook_installed(git_dir)
+        git_hooks = status["git_hooks_installed"]
+        precommit_installed = "pre-commit" in git_hooks
+        postcheckout_installed = "post-checkout" in git_hooks
+        postrewrite_installed = "post-rewrite" in git_hooks
 
         # JSON output mode
         if format == "json":
@@ -279,39 +303,17 @@ def status_command(
             raise typer.Exit(EXIT_SUCCESS)
 
         # Rich table output
-        table = Table(
-            title="Hook Status",
-            show_header=True,
-            header_style="bold cyan"
-        )
-        table.add_column("Hook Type", style="white")
-        table.add_column("Installed", style="white")
-
-        # Helper for checkmark/X display
-        def status_icon(installed: bool) -> str:
-            return "[green]✓[/green]" if installed else "[red]✗[/red]"
+        table = _make_status_table()
 
         # Add rows for each hook type
-        table.add_row(
-            "Git pre-commit",
-            status_icon(precommit_installed)
-        )
-        table.add_row(
-            "Git post-commit",
-            status_icon(status.get("git_hook_installed", False))
-        )
-        table.add_row(
-            "Claude Code Stop",
-            status_icon(status.get("claude_hook_installed", False))
-        )
-        table.add_row(
-            "Git post-checkout",
-            status_icon(postcheckout_installed)
-        )
-        table.add_row(
-            "Git post-rewrite",
-            status_icon(postrewrite_installed)
-        )
+        for hook_type, installed in (
+            ("Git pre-commit", precommit_installed),
+            ("Git post-commit", status.get("git_hook_installed", False)),
+            ("Claude Code Stop", status.get("claude_hook_installed", False)),
+            ("Git post-checkout", postcheckout_installed),
+            ("Git post-rewrite", postrewrite_installed),
+        ):
+            table.add_row(hook_type, _INSTALLED_ICONS[bool(installed)])
 
         console.print(table)
 
@@ -3,11 +3,12 @@
 Indexes git commit history into the knowledge graph.
 Incremental by default — only processes commits not yet indexed.
 """
+import shutil
 import typer
 from typing import Annotated, Optional
 from pathlib import Path
 
-from src.cli.output import console, print_success, print_error, print_warning
+from src.cli.output import console, print_success, print_error, print_warning, maybe_status
 from src.cli.utils import resolve_scope, EXIT_SUCCESS, EXIT_ERROR
 
 
@@ -39,17 +40,16 @@ def index_command(
             )
             raise typer.Exit(EXIT_ERROR)
 
-        # Validate the git repo is accessible
-        try:
-            import git as gitpython
-            gitpython.Repo(str(root), search_parent_directories=True)
-        except gitpython.exc.GitCommandNotFound:
+        # Validate the git repo is accessible. Cheap probes only: opening a
+        # Repo here would read config and refs that GitIndexer reads again.
+        if shutil.which("git") is None:
             print_error(
                 "Git executable not found. Cannot index git history.",
                 suggestion="Install git and ensure it is on your PATH"
             )
             raise typer.Exit(EXIT_ERROR)
-        except gitpython.exc.InvalidGitRepositoryError:
+        # .git is a file rather than a directory in worktrees and submodules
+        if not (root / ".git").exists():
             print_error(
                 "Not in a git repository. Cannot index git history.",
                 suggestion="Navigate to a git repository and try again"
@@ -77,7 +77,7 @@ def index_command(
                 console.print(f"[dim]{msg}[/dim]")
 
         # Run indexing with progress spinner
-        with console.status("Indexing git history...") as status:
+        with maybe_status("Indexing git history..."):
             result = indexer.run(since=since, full=False, verbose=verbose, status_callback=status_callback)
 
         # Handle cooldown case
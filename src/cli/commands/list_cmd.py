@@ -3,19 +3,24 @@
 Provides table, compact, and JSON output formats with filtering by scope,
 type, and tags.
 """
-from typing import Annotated, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated, Optional
 from pathlib import Path
 import typer
-from src.cli.output import console, print_json, print_table, print_compact, print_warning
+from src.cli.output import console, print_json, print_table, print_compact, print_warning, maybe_status
 from src.cli.utils import resolve_scope, DEFAULT_LIMIT
-from src.models import GraphScope
-from src.graph import get_service, run_graph_operation
+
+if TYPE_CHECKING:
+    from src.models import GraphScope
 
 
 def _list_entities(
     scope: GraphScope,
     project_root: Optional[Path],
     limit: Optional[int],
+    type_filter: Optional[str] = None,
+    tags: Optional[list[str]] = None,
 ) -> list[dict]:
     """List entities from the knowledge graph via GraphService.
 
@@ -25,11 +30,17 @@ def _list_entities(
     Args:
         scope: Graph scope to list from
         project_root: Project root path (required for PROJECT scope)
-        limit: Maximum number of entities to return
+        limit: Maximum number of entities to return, applied in the graph
+            query (None for no limit)
+        type_filter: Only return items of this type
+        tags: Only return entities carrying all of these tags
 
     Returns:
         List of entity dictionaries with name, type, created_at, tags, scope, relationship_count
     """
+    # Deferred so other commands don't pay for loading the graph stack
+    from src.graph import get_service, run_graph_operation
+
     # Get service and call list operation
     service = get_service()
     entities = run_graph_operation(
@@ -37,14 +48,11 @@ def _list_entities(
             scope=scope,
             project_root=project_root,
             limit=limit,
+            type_filter=type_filter,
+            tags=tags,
         )
     )
 
-    # Convert tags from list to string if needed (for table display)
-    for entity in entities:
-        if "tags" in entity and isinstance(entity["tags"], list):
-            entity["tags"] = ", ".join(entity["tags"])
-
     return entities
 
 
@@ -70,41 +78,36 @@ def list_command(
     effective_limit = None if all_results else limit
 
     # Load entities with spinner
-    with console.status("[cyan]Loading entities...", spinner="dots"):
-        entities = _list_entities(scope, project_root, effective_limit)
+    with maybe_status("[cyan]Loading entities...", spinner="dots"):
+        entities = _list_entities(
+            scope, project_root, effective_limit, type_filter=type_filter, tags=tag
+        )
 
     # Check if empty
     if not entities:
         print_warning("No entities found.")
         raise typer.Exit(0)
 
-    # Apply limit if specified
+    # The graph layer already caps results at the limit; only slice if a
+    # backend returned more than asked for
     total_count = len(entities)
-    if effective_limit is not None:
+    if effective_limit is not None and total_count > effective_limit:
         entities = entities[:effective_limit]
 
     # Output based on format
     if format == "json":
         print_json(entities)
     elif compact:
-        # For compact view, add snippet field from tags
-        for entity in entities:
-            entity["snippet"] = entity.get("tags", "")
-        print_compact(entities, name_key="name", type_key="type", snippet_key="snippet")
+        # For compact view, show tags as the snippet
+        print_compact(entities, name_key="name", type_key="type", snippet_key="tags")
     else:
-        # Table view with specific columns
-        columns = ["name", "type", "tags", "relationship_count", "created_at"]
-        # Rename relationship_count to "Relations" for display
-        display_entities = []
-        for entity in entities:
-            display_entity = entity.copy()
-            display_entity["Relations"] = display_entity.pop("relationship_count")
-            display_entity["Created"] = display_entity.pop("created_at")
-            display_entities.append(display_entity)
-
+        # Table view with specific columns; headers are aliased to the
+        # entity keys so rows are rendered without copying each dict, and
+        # print_table joins the tag list per cell
         print_table(
-            display_entities,
-            columns=["name", "type", "tags", "Relations", "Created"]
+            entities,
+            columns=["name", "type", "tags", "Relations", "Created"],
+            column_keys={"Relations": "relationship_count", "Created": "created_at"},
         )
 
     # Print count summary
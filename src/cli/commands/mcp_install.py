@@ -0,0 +1,56 @@
+"""graphiti mcp install: register the MCP server with Claude Code."""
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+from src.cli.output import console, print_success, print_json, print_error
+
+
+def install_command(
+    force: Annotated[bool, typer.Option("--force", help="Overwrite existing entries")] = False,
+    format: Annotated[Optional[str], typer.Option("--format", "-f",
+        help="Output format: json")] = None,
+):
+    """Install graphiti MCP server for Claude Code (zero-config setup).
+
+    Writes the server configuration to ~/.claude.json and installs SKILL.md
+    to ~/.claude/skills/graphiti/SKILL.md.
+
+    After running this command, restart Claude Code to activate the server.
+
+    Examples:
+        graphiti mcp install         # Install (skip if already present)
+        graphiti mcp install --force # Overwrite existing entries
+    """
+    try:
+        from src.mcp_server.install import install_mcp_server
+        results = install_mcp_server(force=force)
+
+        if format == "json":
+            print_json(results)
+            return
+
+        if results["claude_json_updated"]:
+            print_success("MCP server registered in ~/.claude.json")
+        else:
+            console.print("[dim]MCP server already registered in ~/.claude.json (use --force to update)[/dim]")
+
+        if results["skill_md_installed"]:
+            skill_path = Path.home() / ".claude" / "skills" / "graphiti" / "SKILL.md"
+            print_success(f"SKILL.md installed to {skill_path}")
+        else:
+            console.print("[dim]SKILL.md already installed (use --force to update)[/dim]")
+
+        if results.get("hooks_installed"):
+            settings_path = Path.cwd() / ".claude" / "settings.json"
+            print_success(f"Stop hook installed in {settings_path}")
+        else:
+            console.print("[dim]Stop hook already installed (use --force to update)[/dim]")
+
+        if results["claude_json_updated"] or results["skill_md_installed"] or results.get("hooks_installed"):
+            console.print("\n[cyan]Restart Claude Code to activate the graphiti MCP server.[/cyan]")
+
+    except Exception as e:
+        print_error(f"Install failed: {str(e)}")
+        raise typer.Exit(1)
@@ -0,0 +1,23 @@
+"""graphiti mcp serve: run the graphiti MCP server."""
+from typing import Annotated
+
+import typer
+
+
+def serve_command(
+    transport: Annotated[str, typer.Option("--transport", "-t",
+        help="Transport type: stdio or streamable-http")] = "stdio",
+    port: Annotated[int, typer.Option("--port", "-p",
+        help="HTTP port (streamable-http only)")] = 8000,
+):
+    """Start the graphiti MCP server.
+
+    stdio transport (default): Claude Code spawns and manages the process.
+    streamable-http: Standalone server on localhost:<port>.
+
+    Examples:
+        graphiti mcp serve                         # stdio (Claude Code managed)
+        graphiti mcp serve --transport streamable-http --port 8080
+    """
+    from src.mcp_server.server import main as run_server
+    run_server(transport=transport, port=port)
@@ -0,0 +1,42 @@
+"""graphiti queue process: drain pending jobs in the foreground."""
+import typer
+
+from src.cli.output import console, print_error
+from src.cli.utils import EXIT_ERROR
+
+
+def process_command():
+    """Process pending jobs manually (CLI fallback).
+
+    Starts the background worker and processes all pending jobs until the queue is empty.
+    This is a fallback for manual processing when the MCP server isn't running.
+
+    The command blocks until all jobs are processed or the worker is stopped.
+
+    Examples:
+        graphiti queue process    # Process all pending jobs
+    """
+    from src.queue import process_queue
+
+    console.print("[cyan]Processing queue...[/cyan]")
+
+    try:
+        # Process queue (blocks until empty)
+        success_count, failure_count = process_queue()
+
+        # Show results
+        total = success_count + failure_count
+        if total == 0:
+            console.print("[dim]Queue was empty - no jobs to process[/dim]")
+        else:
+            result_msg = f"Processed {total} job(s)"
+            if failure_count > 0:
+                result_msg += f" ([green]{success_count}[/green] success, [red]{failure_count}[/red] failed)"
+            else:
+                result_msg += f" ([green]all successful[/green])"
+
+            console.print(result_msg)
+
+    except Exception as e:
+        print_error(f"Failed to process queue: {str(e)}")
+        raise typer.Exit(EXIT_ERROR)
@@ -0,0 +1,45 @@
+"""graphiti queue retry: move dead letter jobs back to the queue."""
+from typing import Annotated
+
+import typer
+
+from src.cli.output import console, print_error, print_success
+from src.cli.utils import EXIT_ERROR
+
+
+def retry_command(
+    job_id: Annotated[
+        str,
+        typer.Argument(help="Dead letter job ID to retry, or 'all' to retry all")
+    ]
+):
+    """Retry failed jobs from dead letter queue.
+
+    Moves a dead letter job (or all dead letter jobs) back to the main queue
+    for reprocessing. The job will be retried with reset attempt counter.
+
+    Examples:
+        graphiti queue retry abc-123-def    # Retry specific job
+        graphiti queue retry all            # Retry all failed jobs
+    """
+    from src.queue import get_queue
+
+    queue = get_queue()
+
+    if job_id.lower() == "all":
+        # Retry all dead letter jobs in one pass over the dead letter table
+        requeued_count = queue.retry_all_dead_letter()
+
+        if requeued_count == 0:
+            console.print("[dim]No jobs in dead letter queue[/dim]")
+            return
+
+        print_success(f"Moved {requeued_count} job(s) back to queue for retry")
+
+    else:
+        # Retry specific job
+        if queue.retry_dead_letter(job_id):
+            print_success(f"Job {job_id} moved back to queue for retry")
+        else:
+            print_error(f"Job {job_id} not found in dead letter queue")
+            raise typer.Exit(EXIT_ERROR)
@@ -0,0 +1,114 @@
+"""graphiti queue status: show queue health, pending and dead letter counts."""
+from typing import Annotated, Optional
+
+import typer
+
+from src.cli.output import console, print_json
+
+# Color-coded health indicator and message per health level
+_HEALTH_ICONS = {
+    "ok": "[green]ok[/green]",
+    "warning": "[yellow]warning[/yellow]",
+    "error": "[red]error[/red]",
+}
+_HEALTH_MESSAGES = {
+    "ok": "Healthy",
+    "warning": "Queue nearly full",
+    "error": "Queue at or over capacity",
+}
+_WORKER_STATUS = {True: "[green]running[/green]", False: "[dim]stopped[/dim]"}
+
+# (header, style) for each column of the status table
+_TABLE_COLUMNS = (
+    ("Status", "white"),
+    ("Pending Jobs", "cyan"),
+    ("Capacity", "white"),
+    ("Dead Letter", "yellow"),
+    ("Worker", "white"),
+    ("Message", "dim"),
+)
+
+
+def _make_status_table():
+    """Return an empty queue status table with its columns configured."""
+    from rich.table import Table
+
+    table = Table(title="Queue Status", show_header=True, header_style="bold cyan")
+    for header, style in _TABLE_COLUMNS:
+        table.add_column(header, style=style)
+    return table
+
+
+def status_command(
+    format: Annotated[
+        Optional[str],
+        typer.Option("--format", "-f", help="Output format: text or json")
+    ] = "text"
+):
+    """Show queue status and health.
+
+    Displays pending job count, dead letter count, worker status, and health indicator.
+    Health levels match 'graphiti health' pattern:
+    - ok: pending < 80% of capacity
+    - warning: pending >= 80% of capacity (queue nearly full)
+    - error: pending >= 100% of capacity (queue at/over capacity)
+
+    Examples:
+        graphiti queue status              # Show status table
+        graphiti queue status --format json  # JSON output for programmatic use
+    """
+    # Imported per command so only the invoked one loads the queue backend
+    from src.queue import get_status
+
+    # Get queue status
+    status = get_status()
+
+    # Determine health message
+    health_msg = _HEALTH_MESSAGES.get(status["health"], "Healthy")
+
+    # JSON output mode
+    if format == "json":
+        output = {
+            "health": status["health"],
+            "pending": status["pending"],
+            "dead_letter": status["dead_letter"],
+            "capacity": {
+                "used": status["pending"],
+                "max": status["max_size"],
+                "percent": status["capacity_pct"]
+            },
+            "worker": "running" if status["worker_running"] else "stopped",
+            "message": health_msg
+        }
+        print_json(output)
+        return
+
+    # Rich table output
+    table = _make_status_table()
+
+    # Color-coded health indicator
+    health_display = _HEALTH_ICONS.get(status["health"], "unknown")
+
+    # Worker status
+    worker_status = _WORKER_STATUS[bool(status["worker_running"])]
+
+    # Capacity format: "45/100"
+    capacity_display = f"{status['pending']}/{status['max_size']}"
+
+    table.add_row(
+        health_display,
+        str(status["pending"]),
+        capacity_display,
+        str(status["dead_letter"]),
+        worker_status,
+        health_msg
+    )
+
+    console.print(table)
+
+    # Add dead letter hint if jobs exist
+    if status["dead_letter"] > 0:
+        console.print(
+            f"\n[yellow]⚠[/yellow] {status['dead_letter']} failed job(s) in dead letter queue"
+        )
+        console.print("[dim]Run 'graphiti queue retry <job_id>' to reprocess failed jobs[/dim]")
@@ -3,15 +3,51 @@
 Searches the knowledge graph with semantic (default) or exact matching,
 supporting filters, result formatting, and pagination.
 """
+from __future__ import annotations
+
+import json
 import typer
-from typing import Annotated, Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Annotated, Optional
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from src.cli.output import console, print_table, print_compact, print_json, print_warning
+from src.cli.cache import get_cached_search, set_cached_search
+from src.cli.output import console, print_table, print_compact, print_json, print_warning, maybe_status
 from src.cli.utils import resolve_scope, DEFAULT_LIMIT, EXIT_SUCCESS, EXIT_ERROR
-from src.models import GraphScope
-from src.graph import get_service, run_graph_operation
+
+if TYPE_CHECKING:
+    from src.models import GraphScope
+
+
+# Relative --since/--before values such as "7d" or "12h"
+_DURATION_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def _is_duration(value: str) -> bool:
+    """Return True for relative date values such as "7d"."""
+    return value[-1:].lower() in _DURATION_UNITS and value[:-1].isdigit()
+
+
+def _parse_date(value: str, option: str) -> datetime:
+    """Parse a --since/--before value into a UTC datetime.
+
+    Accepts a duration counted back from now ("30m", "12h", "7d", "2w") or
+    an ISO date/datetime ("2024-01-01", "2024-01-01T12:00"). Naive values
+    are taken as UTC.
+
+    Raises:
+        typer.BadParameter: If the value is neither form
+    """
+    if _is_duration(value):
+        unit = _DURATION_UNITS[value[-1:].lower()]
+        return datetime.now(timezone.utc) - timedelta(**{unit: int(value[:-1])})
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise typer.BadParameter(
+            f"Invalid {option} value '{value}'. Use a duration like '7d' or a date like '2024-01-01'."
+        )
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
 def _search_entities(
@@ -35,16 +71,34 @@ def _search_entities(
         scope: Graph scope to search in
         project_root: Project root path (required for PROJECT scope)
         exact: Whether to use exact matching (True) or semantic (False)
-        since: Filter results after this date/duration (future enhancement)
-        before: Filter results before this date (future enhancement)
-        type_filter: Filter by type (future enhancement)
-        tags: Filter by tags (future enhancement)
+        since: Only return results created at or after this date/duration
+        before: Only return results created before this date/duration
+        type_filter: Only return results of this type
+        tags: Only return results carrying all of these tags
         limit: Maximum number of results (None for unlimited)
 
     Returns:
         List of result dictionaries with name, type, snippet, score, created_at, scope, tags
+
+    Raises:
+        typer.BadParameter: If since or before cannot be parsed
     """
-    # Get service and call search operation
+    since_dt = _parse_date(since, "--since") if since else None
+    before_dt = _parse_date(before, "--before") if before else None
+
+    # Results for a relative date ("7d") depend on the current time, so
+    # only searches with absolute or no dates are cached
+    cache_key = None
+    if not any(_is_duration(v) for v in (since, before) if v):
+        cache_key = json.dumps([query, exact, since, before, type_filter, sorted(tags or []), limit])
+        cached = get_cached_search(scope, project_root, cache_key)
+        if cached is not None:
+            return cached
+
+    # Deferred so other commands don't pay for loading the graph stack
+    from src.graph import get_service, run_graph_operation
+
+    # Get service and call search operation; filters run inside the query
     service = get_service()
     results = run_graph_operation(
         service.search(
@@ -53,13 +107,15 @@ def _search_entities(
             project_root=project_root,
             exact=exact,
             limit=limit or 15,
+            since=since_dt,
+            before=before_dt,
+            type_filter=type_filter,
+            tags=tags,
         )
     )
 
-    # Note: Date/type/tag filters not yet implemented in GraphService
-    # These will be added in future integration phases
-    # For now, we return all matching results from semantic/exact search
-
+    if cache_key is not None:
+        set_cached_search(scope, project_root, cache_key, results)
     return results
 
 
@@ -97,7 +153,7 @@ def search_command(
         effective_limit = None if all_results else limit
 
         # 3. Search with spinner
-        with console.status("Searching knowledge graph..."):
+        with maybe_status("Searching knowledge graph..."):
             results = _search_entities(
                 query=query,
                 scope=scope,
@@ -122,16 +178,18 @@ def search_command(
             print_compact(results)
         else:
             # Default: table view
-            # Reformat results for table with selected columns
-            table_data = []
-            for r in results:
-                table_data.append({
+            # Reformat results for table with selected columns, one row at a
+            # time as the table consumes them
+            table_data = (
+                {
                     "Name": r["name"],
                     "Type": r["type"],
-                    "Snippet": r["snippet"][:60] + "..." if len(r["snippet"]) > 60 else r["snippet"],
+                    "Snippet": snippet[:60] + "..." if len(snippet := r["snippet"]) > 60 else snippet,
                     "Score": f"{r['score']:.2f}" if "score" in r else "N/A",
-                    "Created": r["created_at"].split("T")[0],  # Just the date
-                })
+                    "Created": r["created_at"].partition("T")[0],  # Just the date
+                }
+                for r in results
+            )
             print_table(table_data, columns=["Name", "Type", "Snippet", "Score", "Created"])
 
         # 6. Print result count
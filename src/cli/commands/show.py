@@ -6,15 +6,12 @@ with JSON output option and ambiguous name resolution.
 from typing import Annotated, Optional
 from pathlib import Path
 import typer
-from rich.panel import Panel
-from rich.text import Text
 from src.cli.output import console, print_json, print_error
 from src.cli.utils import resolve_scope, EXIT_ERROR
-from src.graph import get_service, run_graph_operation
 from src.models import GraphScope
 
 
-def _find_entity(name: str, scope: GraphScope, project_root: Optional[Path] = None) -> dict | list[dict]:
+def _find_entity(name: str, scope: GraphScope, project_root: Optional[Path] = None) -> Optional[dict | list[dict]]:
     """Find entity by name from the knowledge graph.
 
     Args:
@@ -23,15 +20,12 @@ def _find_entity(name: str, scope: GraphScope, project_root: Optional[Path] = No
         project_root: Project root path (required for PROJECT scope)
 
     Returns:
-        Entity dict if unique match found, list of matches if ambiguous, or empty dict if not found
+        Entity dict if unique match found, list of matches if ambiguous, or None if not found
     """
-    result = run_graph_operation(get_service().get_entity(name=name, scope=scope, project_root=project_root))
+    # Deferred so other commands don't pay for loading the graph stack
+    from src.graph import get_service, run_graph_operation
 
-    # Handle None (not found) -> return empty dict for backward compatibility
-    if result is None:
-        return {}
-
-    return result
+    return run_graph_operation(get_service().get_entity(name=name, scope=scope, project_root=project_root))
 
 
 def show_command(
@@ -52,13 +46,19 @@ def show_command(
     result = _find_entity(entity, scope, project_root)
 
     # Handle not found
-    if not result or (isinstance(result, dict) and not result):
+    if result is None:
         print_error(
             f"Entity '{entity}' not found.",
             suggestion="Try 'graphiti list' to see available entities."
         )
         raise typer.Exit(EXIT_ERROR)
 
+    # JSON consumers get the result as-is; ambiguous names come back as the
+    # list of matches instead of an interactive prompt
+    if format == "json":
+        print_json(result)
+        return
+
     # Handle ambiguous matches
     if isinstance(result, list):
         console.print(f"\n[yellow]Multiple entities match '{entity}':[/yellow]\n")
@@ -67,44 +67,52 @@ def show_command(
         for idx, match in enumerate(result, 1):
             console.print(f"  {idx}. [cyan]{match['name']}[/cyan] ({match['type']}) - ID: {match['id']}")
 
-        # Prompt user to choose
-        choice = typer.prompt(f"\nSelect entity [1-{len(result)}]", type=int)
+        # Prompt user to choose; a plain input() is enough for one number
+        try:
+            answer = input(f"\nSelect entity [1-{len(result)}]: ").strip()
+        except EOFError:
+            answer = ""
 
         # Validate choice
-        if choice < 1 or choice > len(result):
-            print_error(f"Invalid selection: {choice}")
+        try:
+            choice = int(answer)
+        except ValueError:
+            choice = 0
+        if not 1 <= choice <= len(result):
+            print_error(f"Invalid selection: {answer or '(none)'}")
             raise typer.Exit(EXIT_ERROR)
 
-        # Get the selected entity by ID (would need another lookup in real implementation)
-        selected_name = result[choice - 1]["name"]
-        result = _find_entity(selected_name, scope, project_root)
+        # Matches already carry full details, so no second lookup is needed
+        result = result[choice - 1]
 
     # Now result is a single entity dict
     entity_data = result
 
-    # JSON output
-    if format == "json":
-        print_json(entity_data)
-        return
-
     # Rich formatted output
+    from rich.panel import Panel
+    from rich.text import Text
+
     # Title panel with entity name
     title = Text(entity_data["name"], style="bold cyan")
     console.print(Panel(title, border_style="cyan"))
 
-    # Metadata section
-    console.print("\n[bold]Metadata:[/bold]")
-    console.print(f"  [dim]ID:[/dim]          {entity_data.get('id', 'N/A')}")
-    console.print(f"  [dim]Type:[/dim]        [magenta]{entity_data['type']}[/magenta]")
-    console.print(f"  [dim]Scope:[/dim]       {entity_data['scope']}")
-    console.print(f"  [dim]Created:[/dim]     [green]{entity_data['created_at']}[/green]")
-    console.print(f"  [dim]Updated:[/dim]     [green]{entity_data['updated_at']}[/green]")
+    # Metadata section, collected and printed in one call
+    metadata = [
+        "\n[bold]Metadata:[/bold]",
+        f"  [dim]ID:[/dim]          {entity_data.get('id', 'N/A')}",
+        f"  [dim]Type:[/dim]        [magenta]{entity_data['type']}[/magenta]",
+        f"  [dim]Scope:[/dim]       {entity_data['scope']}",
+        f"  [dim]Created:[/dim]     [green]{entity_data['created_at']}[/green]",
+        f"  [dim]Updated:[/dim]     [green]{entity_data['updated_at']}[/green]",
+    ]
 
     # Tags
     tags = entity_data.get("tags", [])
     if tags:
         tags_str = ", ".join(tags)
-        console.print(f"  [dim]Tags:[/dim]        {tags_str}")
+        metadata.append(f"  [dim]Tags:[/dim]        {tags_str}")
+
+    console.print("\n".join(metadata))
 
     # Content/description
     content = entity_data.get("content", "")
@@ -115,11 +123,13 @@ def show_command(
     # Relationships
     relationships = entity_data.get("relationships", [])
     if relationships:
-        console.print("\n[bold]Relationships:[/bold]")
-        for rel in relationships:
-            rel_type = rel.get("type", "related_to")
-            target = rel.get("target", "Unknown")
-            console.print(f"  • [yellow]{rel_type}[/yellow] → [cyan]{target}[/cyan]")
+        console.print("\n".join([
+            "\n[bold]Relationships:[/bold]",
+            *(
+                f"  • [yellow]{rel.get('type', 'related_to')}[/yellow] → [cyan]{rel.get('target', 'Unknown')}[/cyan]"
+                for rel in relationships
+            ),
+        ]))
     else:
         console.print("\n[dim]No relationships[/dim]")
 
@@ -5,14 +5,10 @@ Generates LLM-powered summaries of the entire knowledge graph or focused on a sp
 import typer
 from typing import Annotated, Optional
 from pathlib import Path
-from rich.panel import Panel
-from rich.markdown import Markdown
 
 from src.models import GraphScope
 from src.cli.output import console, print_error, print_json, print_warning
 from src.cli.utils import resolve_scope, EXIT_ERROR
-from src.llm import LLMUnavailableError
-from src.graph import get_service, run_graph_operation
 
 
 def _load_entities(scope: GraphScope, topic: Optional[str] = None, project_root: Optional[Path] = None) -> list[dict]:
@@ -26,6 +22,9 @@ def _load_entities(scope: GraphScope, topic: Optional[str] = None, project_root:
     Returns:
         List of entity dictionaries
     """
+    # Deferred so other commands don't pay for loading the graph stack
+    from src.graph import get_service, run_graph_operation
+
     # Load all entities from the graph
     entities = run_graph_operation(get_service().list_entities(scope=scope, project_root=project_root, limit=None))
 
@@ -50,6 +49,8 @@ def _generate_summary(scope: GraphScope, topic: Optional[str] = None, project_ro
     Returns:
         Summary text generated by LLM
     """
+    from src.graph import get_service, run_graph_operation
+
     # Call GraphService.summarize() which handles both entity loading and LLM generation
     summary_text, entity_count = run_graph_operation(
         get_service().summarize(scope=scope, project_root=project_root, topic=topic)
@@ -90,6 +91,8 @@ def summarize_command(
         graphiti summarize "architecture decisions"
         graphiti summarize "llm integration" --format json
     """
+    from src.llm import LLMUnavailableError
+
     try:
         # Resolve scope
         scope, project_root = resolve_scope(global_scope, project_scope)
@@ -132,6 +135,9 @@ def summarize_command(
             })
         else:
             # Rich panel display
+            from rich.markdown import Markdown
+            from rich.panel import Panel
+
             title = f"Knowledge Summary{' - ' + topic if topic else ''}"
             panel = Panel(
                 Markdown(summary_text),
@@ -39,11 +39,10 @@ def read_content(positional: Optional[str] = None) -> str:
 
     # Check if stdin is available (not a TTY means it's piped)
     if not sys.stdin.isatty():
-        # Reconfigure stdin to handle UTF-8 with error replacement
-        sys.stdin.reconfigure(encoding='utf-8', errors='replace')
-
-        # Read all content and strip whitespace
-        content = sys.stdin.read().strip()
+        # Read raw bytes and strip before decoding, so large payloads are
+        # decoded once as UTF-8 (with error replacement) without going
+        # through the text layer or reconfiguring the global stdin
+        content = sys.stdin.buffer.read().strip().decode("utf-8", errors="replace").strip()
 
         # Empty content counts as no content
         if not content:
@@ -0,0 +1,56 @@
+"""Lazily loaded Typer command groups.
+
+A command group normally builds every subcommand's Click command (and imports
+its module) when the CLI starts, even though only one subcommand runs. A
+LazyTyperGroup instead maps subcommand names to "module:function" strings and
+only builds the command that is actually invoked.
+"""
+import importlib
+
+import typer.core
+import typer.main
+import typer.models
+
+
+class LazyTyperGroup(typer.core.TyperGroup):
+    """TyperGroup that resolves subcommands from ``lazy_map`` on first use.
+
+    Subclasses set ``lazy_map`` to an ordered mapping of subcommand name to
+    "module:function", where the function is an undecorated Typer command.
+    Listing commands (e.g. for --help) or asking for an unknown name loads
+    every entry, so help output and typo suggestions stay complete.
+
+    Example:
+        class QueueGroup(LazyTyperGroup):
+            lazy_map = {"status": "src.cli.commands.queue_status:status_command"}
+
+        queue_app = typer.Typer(name="queue", cls=QueueGroup)
+    """
+
+    lazy_map: dict[str, str] = {}
+
+    def list_commands(self, ctx) -> list[str]:
+        """Return lazy subcommand names in map order, then eager ones."""
+        return [*self.lazy_map, *(n for n in self.commands if n not in self.lazy_map)]
+
+    def get_command(self, ctx, cmd_name: str):
+        """Return a subcommand, building it from ``lazy_map`` if needed."""
+        if cmd_name not in self.commands:
+            if cmd_name in self.lazy_map:
+                self.commands[cmd_name] = self._load_command(cmd_name)
+            else:
+                # Unknown name: load everything so suggestions can see it all
+                for name in self.lazy_map:
+                    if name not in self.commands:
+                        self.commands[name] = self._load_command(name)
+        return self.commands.get(cmd_name)
+
+    def _load_command(self, cmd_name: str):
+        """Import a lazy subcommand's function and build its Click command."""
+        module_name, func_name = self.lazy_map[cmd_name].split(":")
+        callback = getattr(importlib.import_module(module_name), func_name)
+        return typer.main.get_command_from_info(
+            typer.models.CommandInfo(name=cmd_name, callback=callback),
+            pretty_exceptions_short=True,
+            rich_markup_mode=self.rich_markup_mode,
+        )
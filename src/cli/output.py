@@ -3,16 +3,30 @@
 Provides a singleton Rich Console instance and formatting functions for
 consistent output across all CLI commands.
 """
+import sys
+from collections.abc import Iterable
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from typing import Any, Optional
 from rich.console import Console
+from rich.highlighter import JSONHighlighter
 from rich.table import Table
 import json
 
+try:
+    import orjson
+except ImportError:  # Optional: pip install graphiti-knowledge-graph[fast-json]
+    orjson = None
+
 
 # Singleton console instances
 console = Console()  # Auto-detects TTY
 err_console = Console(stderr=True)  # For error output
 
+_json_highlighter = JSONHighlighter()
+
 
 def print_success(message: str):
     """Print success message with green checkmark prefix.
@@ -44,55 +58,205 @@ def print_warning(message: str):
     console.print(f"[yellow]⚠[/yellow] {message}")
 
 
+# Bounds on the characters per cell handed to Rich, which measures every
+# character of every cell when laying out a table
+_MIN_CELL_WIDTH = 20
+_MAX_CELL_WIDTH = 80
+
+# Rows buffered per write when printing compact output to a pipe
+_COMPACT_BATCH = 1024
+
+# Above this many rows a table is written as plain tab-separated text; Rich
+# lays out the whole table in memory before printing the first line
+_MAX_RICH_TABLE_ROWS = 1000
+
+# Escapes for TSV cells, so values keep every character but cannot break a row
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _truncate(text: str, width: int) -> str:
+    """Shorten text to at most width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def _cell_text(value: Any) -> str:
+    """Render a cell value as text, joining list values (e.g. tags) with commas."""
+    if type(value) is str:
+        return value
+    if isinstance(value, (list, tuple)):
+        return ", ".join(map(str, value))
+    return str(value)
+
+
+def _format_cell(value: Any, width: int) -> str:
+    """Render a Rich table cell, trimmed to width."""
+    return _truncate(_cell_text(value), width)
+
+
+@lru_cache(maxsize=64)
+def _column_styles(columns: tuple[str, ...]) -> tuple[Optional[str], ...]:
+    """Pick a style for each column from its name (e.g. ids cyan, dates green)."""
+    styles = []
+    for col in columns:
+        col_lower = col.lower()
+        if "name" in col_lower or "id" in col_lower:
+            styles.append("cyan")
+        elif "type" in col_lower:
+            styles.append("magenta")
+        elif "date" in col_lower or "time" in col_lower:
+            styles.append("green")
+        else:
+            styles.append(None)
+    return tuple(styles)
+
+
 def print_table(
-    data: list[dict],
+    data: Iterable[dict],
     title: Optional[str] = None,
     columns: Optional[list[str]] = None,
+    column_keys: Optional[dict[str, str]] = None,
 ):
     """Print data as a Rich Table with auto-detected columns.
 
+    Results with more than 1000 rows are written to stdout as tab-separated
+    text instead, since Rich renders a table only once every row is added.
+    TSV cells are written in full, with backslashes, tabs and newlines
+    backslash-escaped; the title goes to stderr so stdout stays pure data.
+
     Args:
-        data: List of dictionaries to display as table rows
+        data: Dictionaries to display as table rows (any iterable; consumed once)
         title: Optional table title
         columns: Optional explicit column list (defaults to dict keys)
+        column_keys: Optional map of column header to the row key it shows,
+            for columns whose header differs from the dict key
     """
-    if not data:
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
         console.print("[dim]No results[/dim]")
         return
 
     # Auto-detect columns from first row if not provided
     if columns is None:
-        columns = list(data[0].keys())
+        columns = list(first.keys())
+    keys = [column_keys.get(col, col) for col in columns] if column_keys else columns
+
+    # Cells longer than an even share of the terminal would be wrapped or cut
+    # by Rich anyway; trimming them first keeps its measuring pass bounded
+    width = min(max(console.width // len(columns), _MIN_CELL_WIDTH), _MAX_CELL_WIDTH)
+
+    # Buffer up to the Rich limit; anything beyond it goes out as plain text
+    head = [first, *islice(rows, _MAX_RICH_TABLE_ROWS - 1)]
+    overflow = next(rows, None)
+    if overflow is not None:
+        if title:
+            err_console.print(title)
+        _write_tsv(chain(head, (overflow,), rows), columns, keys)
+        return
 
     # Create table with styling
     table = Table(title=title, show_header=True, header_style="bold cyan")
 
-    # Add columns with type-specific styling
-    for col in columns:
-        col_lower = col.lower()
-        if "name" in col_lower or "id" in col_lower:
-            table.add_column(col, style="cyan")
-        elif "type" in col_lower:
-            table.add_column(col, style="magenta")
-        elif "date" in col_lower or "time" in col_lower:
-            table.add_column(col, style="green")
-        else:
-            table.add_column(col)
-
-    # Add rows
-    for row in data:
-        table.add_row(*[str(row.get(col, "")) for col in columns])
+    # Add columns with type-specific styling. Cells are already trimmed to
+    # width, so no_wrap lets Rich skip measuring wrap points
+    for col, style in zip(columns, _column_styles(tuple(columns))):
+        table.add_column(col, style=style, no_wrap=True, overflow="ellipsis")
+
+    # Add rows. Every row has the same keys in practice, so fetch cells with
+    # one itemgetter call and fall back to per-key .get() for ragged rows
+    getter = itemgetter(*keys) if len(keys) > 1 else (lambda row: (row[keys[0]],))
+    for row in head:
+        try:
+            values = getter(row)
+        except KeyError:
+            values = [row.get(key, "") for key in keys]
+        table.add_row(*[_format_cell(value, width) for value in values])
 
     console.print(table)
 
 
+def _write_tsv(rows: Iterable[dict], columns: list[str], keys: list[str]):
+    """Write rows as tab-separated text with a header line, in batches.
+
+    Cells are not truncated; tabs, newlines and backslashes are escaped.
+    """
+    def line(values) -> str:
+        return "\t".join(v.translate(_TSV_ESCAPES) for v in values) + "\n"
+
+    write = sys.stdout.write
+    write(line(columns))
+    batch = []
+    for row in rows:
+        batch.append(line(_cell_text(row.get(key, "")) for key in keys))
+        if len(batch) >= _COMPACT_BATCH:
+            write("".join(batch))
+            batch.clear()
+    write("".join(batch))
+
+
+def maybe_status(message: str, **kwargs):
+    """Return a Rich status spinner, or a no-op context when not on a terminal.
+
+    A spinner on piped output only costs a refresh thread and escape codes
+    that nothing displays.
+
+    Args:
+        message: Status message shown next to the spinner
+        **kwargs: Extra arguments for Console.status (e.g. spinner="dots")
+
+    Returns:
+        Context manager to wrap the slow operation in
+    """
+    if console.is_terminal:
+        return console.status(message, **kwargs)
+    return nullcontext()
+
+
 def print_json(data: dict | list):
     """Print data as syntax-highlighted JSON.
 
+    Serializes with orjson when it is installed, falling back to the stdlib
+    for data orjson cannot encode. Values neither can encode natively (e.g.
+    datetimes without orjson) are written as their str(). When stdout is not
+    a terminal (e.g. piped to jq) the JSON is written directly to stdout
+    without going through rich, as raw bytes when orjson produced it.
+
     Args:
         data: Dictionary or list to display as JSON
     """
-    console.print_json(data=data)
+    raw = None
+    if orjson is not None:
+        try:
+            raw = orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            pass
+
+    if not console.is_terminal:
+        buffer = getattr(sys.stdout, "buffer", None)
+        if raw is not None and buffer is not None:
+            # orjson already produced UTF-8; skip the decode/encode round trip
+            sys.stdout.flush()
+            buffer.write(raw)
+            buffer.flush()
+        elif raw is not None:
+            sys.stdout.write(raw.decode())
+        else:
+            sys.stdout.write(json.dumps(data, indent=2, ensure_ascii=False, default=str) + "\n")
+        return
+
+    text = raw.decode().rstrip("\n") if raw is not None else None
+
+    if text is not None:
+        highlighted = _json_highlighter(text)
+        highlighted.no_wrap = True
+        highlighted.overflow = None
+        console.print(highlighted, soft_wrap=True)
+        return
+
+    console.print_json(data=data, default=str)
 
 
 def print_compact(
@@ -103,20 +267,30 @@ def print_compact(
 ):
     """Print items in compact one-line-per-result format.
 
+    On a terminal the lines are styled and printed in one Rich call. When
+    stdout is not a terminal they are written as plain text in batches,
+    bypassing Rich's markup parsing entirely.
+
     Args:
         items: List of items to display
         name_key: Dictionary key for item name
         type_key: Dictionary key for item type
-        snippet_key: Dictionary key for content snippet
+        snippet_key: Dictionary key for content snippet (list values are
+            joined with commas)
     """
     if not items:
         console.print("[dim]No results[/dim]")
         return
 
+    styled = console.is_terminal
+    lines = []
     for item in items:
         name = item.get(name_key, "Unknown")
         item_type = item.get(type_key, "")
         snippet = item.get(snippet_key, "")
+        if isinstance(snippet, (list, tuple)):
+            # e.g. tags used as the snippet
+            snippet = ", ".join(map(str, snippet))
 
         # Truncate snippet to 60 characters
         if len(snippet) > 60:
@@ -126,7 +300,18 @@ def print_compact(
         type_str = f" ({item_type})" if item_type else ""
         snippet_str = f" - {snippet}" if snippet else ""
 
-        console.print(f"[cyan]{name}[/cyan]{type_str}{snippet_str}")
+        if styled:
+            lines.append(f"[cyan]{name}[/cyan]{type_str}{snippet_str}")
+            continue
+        lines.append(f"{name}{type_str}{snippet_str}\n")
+        if len(lines) >= _COMPACT_BATCH:
+            sys.stdout.write("".join(lines))
+            lines.clear()
+
+    if styled:
+        console.print("\n".join(lines))
+    elif lines:
+        sys.stdout.write("".join(lines))
 
 
 def format_output(data: dict | list, fmt: Optional[str] = None):
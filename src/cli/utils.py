@@ -4,6 +4,7 @@ Provides scope resolution, typo suggestions, confirmation prompts,
 exit codes, and other common utilities.
 """
 import difflib
+import sys
 import typer
 from pathlib import Path
 from typing import Optional
@@ -20,6 +21,9 @@ EXIT_BAD_ARGS = 2
 # Default result limit per user decision (10-20 range, 15 chosen)
 DEFAULT_LIMIT = 15
 
+# Answers accepted as "yes" when confirming from piped stdin
+_CONFIRM_YES = frozenset(("y", "yes"))
+
 # Valid CLI commands for typo suggestions
 VALID_COMMANDS = [
     "add",
@@ -61,6 +65,10 @@ def suggest_command(invalid: str, cutoff: float = 0.6) -> Optional[str]:
 def confirm_action(message: str, force: bool = False) -> bool:
     """Prompt user for confirmation before dangerous actions.
 
+    When stdin is not a terminal (e.g. ``graphiti compact < answer.txt``),
+    a single line is read with ``input()`` instead of going through
+    typer's interactive prompt.
+
     Args:
         message: Confirmation message to display
         force: If True, skip prompt and return True immediately
@@ -75,6 +83,13 @@ def confirm_action(message: str, force: bool = False) -> bool:
     if force:
         return True
 
+    if not sys.stdin.isatty():
+        try:
+            answer = input(f"{message} [y/N]: ")
+        except EOFError:
+            return False
+        return answer.strip().lower() in _CONFIRM_YES
+
     return typer.confirm(message, abort=False)
 
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 # Global scope database path: ~/.graphiti/global/graphiti.kuzu
@@ -8,6 +9,7 @@ GLOBAL_DB_PATH = GLOBAL_DB_DIR / "graphiti.kuzu"
 PROJECT_DB_DIR_NAME = ".graphiti"
 PROJECT_DB_NAME = "graphiti.kuzu"
 
+@lru_cache(maxsize=32)
 def get_project_db_path(project_root: Path) -> Path:
     """Get the database path for a project scope"""
     return project_root / PROJECT_DB_DIR_NAME / PROJECT_DB_NAME
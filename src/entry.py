@@ -0,0 +1,48 @@
+"""Console-script entry point for the graphiti and gk commands.
+
+Kept outside src.cli on purpose: importing src.cli loads Typer, Rich and
+every command module, which is wasted work for ``graphiti --version``. This
+module answers that with the standard library alone and only imports the
+CLI for everything else.
+"""
+import sys
+
+
+def get_version() -> str:
+    """Return the installed package version string."""
+    import importlib.metadata
+    try:
+        return importlib.metadata.version("graphiti-knowledge-graph")
+    except importlib.metadata.PackageNotFoundError:
+        return "0.1.0 (development)"
+
+
+def _fast_path(argv: list[str]) -> bool:
+    """Answer trivial invocations without importing the CLI.
+
+    Only an exact, bare ``--version`` or ``-v`` is handled here; everything
+    else (including abbreviations, subcommands and --help) falls through to
+    the Typer app so it parses and reports errors as usual.
+
+    Args:
+        argv: Command-line arguments (without program name)
+
+    Returns:
+        True if the invocation was fully handled, False otherwise
+    """
+    if argv in (["--version"], ["-v"]):
+        print(f"graphiti version {get_version()}")
+        return True
+    return False
+
+
+def cli_entry():
+    """Entry point for console_scripts.
+
+    This function is registered in pyproject.toml as both 'graphiti' and 'gk'.
+    """
+    if _fast_path(sys.argv[1:]):
+        return
+
+    from src.cli import cli_entry as run_cli
+    run_cli()
@@ -16,10 +16,12 @@ import os
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from graphiti_core import Graphiti
-from graphiti_core.nodes import EntityNode, EpisodeType, Node
+from graphiti_core.models.nodes.node_db_queries import get_entity_node_return_query
+from graphiti_core.nodes import EntityNode, EpisodeType, Node, get_entity_node_from_record
+from graphiti_core.search.search_filters import ComparisonOperator, DateFilter, SearchFilters
 
 from src.config.paths import GLOBAL_DB_PATH, get_project_db_path
 from src.graph.adapters import NoOpCrossEncoder, OllamaEmbedder, OllamaLLMClient
@@ -29,6 +31,13 @@ from src.llm.config import load_config
 from src.models import GraphScope
 from src.security import sanitize_content as secure_content
 from src.storage import GraphManager
+from src.storage.write_generation import bump_write_generation
+
+try:
+    import uvloop
+    _loop_factory = uvloop.new_event_loop
+except ImportError:  # Optional: pip install graphiti-knowledge-graph[uvloop]
+    _loop_factory = None
 
 logger = structlog.get_logger(__name__)
 
@@ -58,7 +67,8 @@ def run_graph_operation(coro):
     """Run an async graph operation from sync context.
 
     This helper allows CLI commands (which are sync) to call async
-    GraphService methods cleanly.
+    GraphService methods cleanly. Uses a uvloop event loop when uvloop is
+    installed, otherwise the default asyncio loop.
 
     Args:
         coro: Coroutine to run
@@ -69,7 +79,7 @@ def run_graph_operation(coro):
     Example:
         result = run_graph_operation(service.add(...))
     """
-    return asyncio.run(coro)
+    return asyncio.run(coro, loop_factory=_loop_factory)
 
 
 class GraphService:
@@ -242,14 +252,29 @@ class GraphService:
             elif project_root:
                 db_path = str(get_project_db_path(project_root))
 
-        # Calculate size
+        # Calculate size in a single scandir pass; DirEntry carries the file
+        # type from readdir, so only regular files are stat()ed
         size_bytes = 0
         if db_path:
             try:
-                for dirpath, dirnames, filenames in os.walk(db_path):
-                    for f in filenames:
-                        fp = os.path.join(dirpath, f)
-                        size_bytes += os.path.getsize(fp)
+                if os.path.isfile(db_path):
+                    # Kuzu stores the database as a single file (plus a .wal)
+                    parent, name = os.path.split(db_path)
+                    with os.scandir(parent or ".") as it:
+                        for entry in it:
+                            if entry.name.startswith(name) and entry.is_file():
+                                size_bytes += entry.stat().st_size
+                else:
+                    stack = [db_path]
+                    while stack:
+                        with os.scandir(stack.pop()) as it:
+                            for entry in it:
+                                if entry.is_dir(follow_symlinks=False):
+                                    stack.append(entry.path)
+                                elif entry.is_file():
+                                    size_bytes += entry.stat().st_size
+            except FileNotFoundError:
+                size_bytes = 0
             except OSError as ose:
                 logger.warning(
                     "Could not calculate database size", path=db_path, error=str(ose)
@@ -258,6 +283,18 @@ class GraphService:
 
         return size_bytes
 
+    def _mark_written(self, scope: GraphScope, project_root: Optional[Path]) -> None:
+        """Bump the scope's write generation so caches keyed on it go stale.
+
+        Args:
+            scope: Graph scope that was written to
+            project_root: Project root path (for PROJECT scope)
+        """
+        if scope == GraphScope.GLOBAL:
+            bump_write_generation(GLOBAL_DB_PATH)
+        elif project_root:
+            bump_write_generation(get_project_db_path(project_root))
+
     async def add(
         self,
         content: str,
@@ -316,6 +353,7 @@ class GraphService:
                 source=EpisodeType.text,
                 group_id=group_id,
             )
+            self._mark_written(scope, project_root)
 
             # Return success result
             # Note: graphiti.add_episode doesn't return created nodes/edges count
@@ -348,15 +386,26 @@ class GraphService:
         project_root: Optional[Path],
         exact: bool = False,
         limit: int = 15,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        type_filter: Optional[str] = None,
+        tags: Optional[list[str]] = None,
     ) -> list[dict]:
         """Search the knowledge graph.
 
+        Filters are passed to graphiti as SearchFilters, so they become part
+        of the Kuzu query rather than being applied to the results in Python.
+
         Args:
             query: Search query text
             scope: Graph scope
             project_root: Project root path (required for PROJECT scope)
             exact: If True, use exact string matching; if False, use semantic search
             limit: Maximum number of results
+            since: Only return results created at or after this time
+            before: Only return results created before this time
+            type_filter: Only return results of this type
+            tags: Only return relationships whose entities carry all of these tags
 
         Returns:
             List of result dicts with: name, type, snippet, score, created_at, scope, tags
@@ -372,6 +421,26 @@ class GraphService:
             limit=limit,
         )
 
+        # Search returns relationships (edges) only
+        if type_filter is not None and type_filter != "relationship":
+            return []
+
+        search_filter = None
+        if since or before or tags:
+            date_filters = []
+            if since:
+                date_filters.append(
+                    DateFilter(date=since, comparison_operator=ComparisonOperator.greater_than_equal)
+                )
+            if before:
+                date_filters.append(
+                    DateFilter(date=before, comparison_operator=ComparisonOperator.less_than)
+                )
+            search_filter = SearchFilters(
+                created_at=[date_filters] if date_filters else None,
+                node_labels=tags or None,
+            )
+
         graphiti = await self._get_graphiti(scope, project_root)
         group_id = self._get_group_id(scope, project_root)
 
@@ -386,6 +455,7 @@ class GraphService:
                 query=query,
                 group_ids=[group_id],
                 num_results=limit,
+                search_filter=search_filter,
             )
 
             # Convert results to dict format
@@ -417,33 +487,85 @@ class GraphService:
             )
             raise
 
+    @staticmethod
+    async def _get_entities_with_tags(
+        driver, group_id: str, tags: list[str], limit: Optional[int]
+    ) -> list[EntityNode]:
+        """Fetch entities carrying all of the given tags (labels).
+
+        Mirrors EntityNode.get_by_group_ids() with the tag predicate added,
+        so the filter runs in Kuzu instead of over every entity in Python.
+
+        Args:
+            driver: Graphiti graph driver
+            group_id: Group ID for the scope
+            tags: Tags that must all be present (must be non-empty)
+            limit: Maximum number of entities to return
+
+        Returns:
+            Matching EntityNode objects, newest UUID first
+        """
+        limit_query = "LIMIT $limit" if limit is not None else ""
+        records, _, _ = await driver.execute_query(
+            """
+            MATCH (n:Entity)
+            WHERE n.group_id = $group_id
+              AND all(t IN $tags WHERE list_contains(n.labels, t))
+            RETURN
+            """
+            + get_entity_node_return_query(driver.provider)
+            + """
+            ORDER BY n.uuid DESC
+            """
+            + limit_query,
+            group_id=group_id,
+            tags=list(tags),
+            limit=limit,
+        )
+        return [get_entity_node_from_record(record, driver.provider) for record in records]
+
     async def list_entities(
         self,
         scope: GraphScope,
         project_root: Optional[Path],
         limit: Optional[int] = 50,
+        type_filter: Optional[str] = None,
+        tags: Optional[list[str]] = None,
     ) -> list[dict]:
         """List entities in the knowledge graph.
 
+        Filters are evaluated by Kuzu so only matching rows are returned.
+
         Args:
             scope: Graph scope
             project_root: Project root path (required for PROJECT scope)
             limit: Maximum number of entities to return
+            type_filter: Only return items of this type (only "entity" is listed)
+            tags: Only return entities carrying all of these tags
 
         Returns:
             List of entity dicts with: name, type, created_at, tags, scope, relationship_count
         """
         logger.info("Listing entities", scope=scope.value, limit=limit)
 
+        # Every listed item is an entity, so any other type matches nothing
+        if type_filter is not None and type_filter != "entity":
+            return []
+
         try:
             # Get graphiti instance and group_id
             graphiti = await self._get_graphiti(scope, project_root)
             group_id = self._get_group_id(scope, project_root)
 
-            # Query entities from graph using EntityNode.get_by_group_ids()
-            entities = await EntityNode.get_by_group_ids(
-                graphiti.driver, group_ids=[group_id], limit=limit
-            )
+            if tags:
+                entities = await self._get_entities_with_tags(
+                    graphiti.driver, group_id, tags, limit
+                )
+            else:
+                # Query entities from graph using EntityNode.get_by_group_ids()
+                entities = await EntityNode.get_by_group_ids(
+                    graphiti.driver, group_ids=[group_id], limit=limit
+                )
 
             # Convert EntityNode objects to dicts
             result_list = []
@@ -574,6 +696,7 @@ class GraphService:
 
                 # Build entity dict
                 entity_dict = {
+                    "id": record["uuid"],
                     "name": record["name"],
                     "type": "entity",
                     "created_at": (
@@ -605,6 +728,31 @@ class GraphService:
             )
             raise
 
+    async def get_entities(
+        self,
+        names: list[str],
+        scope: GraphScope,
+        project_root: Optional[Path],
+    ) -> dict[str, dict | list[dict] | None]:
+        """Get entity details for several names in one operation.
+
+        Resolves every name on the same Graphiti instance and event loop,
+        so callers pay the setup cost once instead of once per name.
+
+        Args:
+            names: Entity names to search for (duplicates are resolved once)
+            scope: Graph scope
+            project_root: Project root path (required for PROJECT scope)
+
+        Returns:
+            Mapping of each name to its get_entity() result: a dict for a
+            single match, a list of dicts if ambiguous, or None if not found
+        """
+        return {
+            name: await self.get_entity(name=name, scope=scope, project_root=project_root)
+            for name in dict.fromkeys(names)
+        }
+
     async def delete_entities(
         self,
         names: list[str],
@@ -649,6 +797,7 @@ class GraphService:
 
             # Delete using graphiti_core's API (handles Kuzu-specific deletion)
             await Node.delete_by_uuids(driver, uuids_to_delete)
+            self._mark_written(scope, project_root)
 
             logger.info("Deleted entities", count=len(uuids_to_delete))
             return len(uuids_to_delete)
@@ -751,12 +900,15 @@ class GraphService:
         self,
         scope: GraphScope,
         project_root: Optional[Path],
+        progress: Optional[Callable[[str, float], None]] = None,
     ) -> dict:
         """Compact the knowledge graph by removing duplicates.
 
         Args:
             scope: Graph scope
             project_root: Project root path (required for PROJECT scope)
+            progress: Optional callback invoked as each stage starts, with a
+                description and the fraction of work completed (0.0-1.0)
 
         Returns:
             Dict with: merged_count, removed_count, new_entity_count, new_size_bytes
@@ -769,52 +921,81 @@ class GraphService:
             driver = graphiti.driver
             group_id = self._get_group_id(scope, project_root)
 
-            # Load all entities
-            entities = await EntityNode.get_by_group_ids(
-                driver, group_ids=[group_id], limit=1000
+            # Find duplicate buckets with the same normalized-name aggregation
+            # get_stats() and has_duplicates() use, so the count they report
+            # is exactly what gets merged, across the whole graph
+            if progress:
+                progress("Loading entities...", 0.0)
+            key_records, _, _ = await driver.execute_query(
+                """
+                MATCH (n:Entity)
+                WHERE n.group_id = $group_id
+                WITH lower(trim(n.name)) AS key, count(n) AS cnt
+                WHERE cnt > 1
+                RETURN key
+                """,
+                group_id=group_id,
             )
-            original_count = len(entities)
-
-            # Early return if no entities or only one entity
-            if len(entities) <= 1:
-                return {
-                    "merged_count": 0,
-                    "removed_count": 0,
-                    "new_entity_count": original_count,
-                    "new_size_bytes": 0,
-                }
+            duplicate_keys = [r["key"] for r in key_records]
 
-            # Find duplicates by grouping entities with identical lowercased names
-            name_groups: dict[str, list] = defaultdict(list)
-            for entity in entities:
-                name_groups[entity.name.lower().strip()].append(entity)
+            if progress:
+                progress("Merging duplicates...", 1 / 3)
 
-            # Groups with more than 1 entity are duplicates
-            duplicate_groups = {k: v for k, v in name_groups.items() if len(v) > 1}
+            # Only entities in duplicate buckets are fetched, and only the
+            # fields needed to pick the one to keep
+            name_groups: dict[str, list[tuple[str, int]]] = defaultdict(list)
+            if duplicate_keys:
+                member_records, _, _ = await driver.execute_query(
+                    """
+                    MATCH (n:Entity)
+                    WHERE n.group_id = $group_id AND lower(trim(n.name)) IN $keys
+                    RETURN n.uuid AS uuid,
+                           lower(trim(n.name)) AS key,
+                           size(coalesce(n.summary, '')) AS summary_len
+                    """,
+                    group_id=group_id,
+                    keys=duplicate_keys,
+                )
+                for r in member_records:
+                    name_groups[r["key"]].append((r["uuid"], r["summary_len"]))
 
             # For each duplicate group, keep the entity with the most information
-            removed_count = 0
+            # and collect the rest for a single batched delete
+            uuids_to_remove = []
             merged_count = 0
-            for name_key, group in duplicate_groups.items():
-                # Sort by summary length descending - keep the most complete entity
-                group.sort(key=lambda e: len(e.summary or ""), reverse=True)
-                keep = group[0]  # Entity with most information
-                to_remove = group[1:]  # Duplicates to delete
-
-                if to_remove:
-                    # Delete duplicate entity nodes
-                    uuids_to_remove = [e.uuid for e in to_remove]
-                    await Node.delete_by_uuids(driver, uuids_to_remove)
-                    removed_count += len(to_remove)
-                    merged_count += 1
-
-            # Get new entity count after compaction
-            remaining = await EntityNode.get_by_group_ids(driver, group_ids=[group_id])
-            new_entity_count = len(remaining)
+            for group in name_groups.values():
+                if len(group) < 2:
+                    continue
+                # Keep the entity with the longest summary - the most complete one
+                keep_uuid, _ = max(group, key=lambda member: member[1])
+                uuids_to_remove.extend(uuid for uuid, _ in group if uuid != keep_uuid)
+                merged_count += 1
+
+            removed_count = len(uuids_to_remove)
+            if uuids_to_remove:
+                await Node.delete_by_uuids(driver, uuids_to_remove)
+                self._mark_written(scope, project_root)
+
+            if progress:
+                progress("Finalizing...", 2 / 3)
+
+            # Count remaining entities without hydrating them
+            count_records, _, _ = await driver.execute_query(
+                """
+                MATCH (n:Entity)
+                WHERE n.group_id = $group_id
+                RETURN count(n) AS cnt
+                """,
+                group_id=group_id,
+            )
+            new_entity_count = count_records[0]["cnt"] if count_records else 0
 
             # Get database size
             size_bytes = self._get_db_size(scope, project_root, driver)
 
+            if progress:
+                progress("Done", 1.0)
+
             logger.info(
                 "Compaction complete",
                 merged_count=merged_count,
@@ -859,47 +1040,73 @@ class GraphService:
             driver = graphiti.driver
             group_id = self._get_group_id(scope, project_root)
 
-            # Count entities
-            entity_records, _, _ = await driver.execute_query(
-                """
-                MATCH (n:Entity)
-                WHERE n.group_id = $group_id
-                RETURN count(n) AS cnt
-                """,
-                group_id=group_id,
+            # Walk the database directory in a worker thread while the count
+            # queries run; the two are independent I/O workloads.
+            size_task = asyncio.create_task(
+                asyncio.to_thread(self._get_db_size, scope, project_root, driver)
             )
-            entity_count = entity_records[0]["cnt"] if entity_records else 0
 
-            # Count relationships (RelatesToNode_ nodes represent edges in Kuzu)
-            rel_records, _, _ = await driver.execute_query(
-                """
-                MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
-                WHERE e.group_id = $group_id
-                RETURN count(e) AS cnt
-                """,
-                group_id=group_id,
-            )
-            relationship_count = rel_records[0]["cnt"] if rel_records else 0
+            try:
+                # Count entities
+                entity_records, _, _ = await driver.execute_query(
+                    """
+                    MATCH (n:Entity)
+                    WHERE n.group_id = $group_id
+                    RETURN count(n) AS cnt
+                    """,
+                    group_id=group_id,
+                )
+                entity_count = entity_records[0]["cnt"] if entity_records else 0
 
-            # Count episodes
-            ep_records, _, _ = await driver.execute_query(
-                """
-                MATCH (e:Episodic)
-                WHERE e.group_id = $group_id
-                RETURN count(e) AS cnt
-                """,
-                group_id=group_id,
-            )
-            episode_count = ep_records[0]["cnt"] if ep_records else 0
+                # Count relationships (RelatesToNode_ nodes represent edges in Kuzu)
+                rel_records, _, _ = await driver.execute_query(
+                    """
+                    MATCH (n:Entity)-[:RELATES_TO]->(e:RelatesToNode_)-[:RELATES_TO]->(m:Entity)
+                    WHERE e.group_id = $group_id
+                    RETURN count(e) AS cnt
+                    """,
+                    group_id=group_id,
+                )
+                relationship_count = rel_records[0]["cnt"] if rel_records else 0
 
-            # Calculate database size
-            size_bytes = self._get_db_size(scope, project_root, driver)
+                # Count episodes
+                ep_records, _, _ = await driver.execute_query(
+                    """
+                    MATCH (e:Episodic)
+                    WHERE e.group_id = $group_id
+                    RETURN count(e) AS cnt
+                    """,
+                    group_id=group_id,
+                )
+                episode_count = ep_records[0]["cnt"] if ep_records else 0
+
+                # Count duplicates with the same normalized-name bucketing compact()
+                # uses, aggregated inside Kuzu so entities are never hydrated
+                dup_records, _, _ = await driver.execute_query(
+                    """
+                    MATCH (n:Entity)
+                    WHERE n.group_id = $group_id
+                    WITH lower(trim(n.name)) AS key, count(n) AS cnt
+                    WHERE cnt > 1
+                    RETURN sum(cnt - 1) AS cnt
+                    """,
+                    group_id=group_id,
+                )
+                duplicate_count = int(dup_records[0]["cnt"] or 0) if dup_records else 0
+
+                # Collect database size from the background walk
+                size_bytes = await size_task
+            finally:
+                # A failed count query must not leave the walk unawaited
+                if not size_task.done():
+                    size_task.cancel()
+                await asyncio.gather(size_task, return_exceptions=True)
 
             return {
                 "entity_count": entity_count,
                 "relationship_count": relationship_count,
                 "episode_count": episode_count,
-                "duplicate_count": 0,  # Duplicate detection is handled by compact()
+                "duplicate_count": duplicate_count,
                 "size_bytes": size_bytes,
             }
 
@@ -917,3 +1124,47 @@ class GraphService:
                 "duplicate_count": 0,
                 "size_bytes": 0,
             }
+
+    async def has_duplicates(
+        self,
+        scope: GraphScope,
+        project_root: Optional[Path],
+    ) -> bool:
+        """Check whether the graph contains any duplicate entities.
+
+        Cheaper than get_stats() when only the compaction decision is needed:
+        stops at the first duplicated normalized name and skips the other
+        counts and the database size walk.
+
+        Args:
+            scope: Graph scope
+            project_root: Project root path (required for PROJECT scope)
+
+        Returns:
+            True if at least two entities share a normalized name
+        """
+        try:
+            graphiti = await self._get_graphiti(scope, project_root)
+            group_id = self._get_group_id(scope, project_root)
+
+            records, _, _ = await graphiti.driver.execute_query(
+                """
+                MATCH (n:Entity)
+                WHERE n.group_id = $group_id
+                WITH lower(trim(n.name)) AS key, count(n) AS cnt
+                WHERE cnt > 1
+                RETURN key
+                LIMIT 1
+                """,
+                group_id=group_id,
+            )
+            return bool(records)
+
+        except Exception as e:
+            logger.error(
+                "Failed to check for duplicates",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            # Best-effort like get_stats: treat as clean on failure
+            return False
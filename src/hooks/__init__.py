@@ -7,6 +7,7 @@ This package provides:
 """
 
 from .installer import (
+    get_installed_git_hooks,
     install_claude_hook,
     install_git_hook,
     is_git_hook_installed,
@@ -25,6 +26,7 @@ __all__ = [
     "install_git_hook",
     "uninstall_git_hook",
     "is_git_hook_installed",
+    "get_installed_git_hooks",
     "install_claude_hook",
     "uninstall_claude_hook",
     "install_hooks",
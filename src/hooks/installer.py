@@ -5,6 +5,7 @@ for idempotent and reversible operations.
 """
 
 import json
+import os
 import re
 from pathlib import Path
 from typing import Optional
@@ -16,6 +17,9 @@ logger = structlog.get_logger(__name__)
 HOOK_START_MARKER = "# GRAPHITI_HOOK_START"
 HOOK_END_MARKER = "# GRAPHITI_HOOK_END"
 
+# Git hook types graphiti may install into .git/hooks
+GIT_HOOK_TYPES = ("pre-commit", "post-commit", "post-merge", "post-checkout", "post-rewrite")
+
 
 def _get_hook_template(hook_type: str = "post-commit") -> str:
     """Read a hook template from the templates directory.
@@ -439,6 +443,35 @@ def _is_hook_installed(hook_type: str, repo_path: Path) -> bool:
         return False
 
 
+def get_installed_git_hooks(repo_path: Path) -> set[str]:
+    """Return the git hook types that have a graphiti section installed.
+
+    Lists .git/hooks once and only reads the hook files that exist, instead
+    of probing each hook path separately.
+
+    Args:
+        repo_path: Path to git repository
+
+    Returns:
+        Set of hook type names (e.g. {"pre-commit", "post-commit"})
+    """
+    hooks_dir = repo_path / ".git" / "hooks"
+    try:
+        with os.scandir(hooks_dir) as it:
+            present = [e.path for e in it if e.name in GIT_HOOK_TYPES and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+    installed = set()
+    for hook_path in present:
+        try:
+            if HOOK_START_MARKER in Path(hook_path).read_text():
+                installed.add(os.path.basename(hook_path))
+        except Exception as e:
+            logger.warning("Failed to read hook file", path=hook_path, error=str(e))
+    return installed
+
+
 def _uninstall_hook(hook_type: str, repo_path: Path) -> bool:
     """Remove graphiti section from a git hook (generalized helper).
 
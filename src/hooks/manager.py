@@ -16,9 +16,9 @@ import structlog
 _GRAPHITI_CLI = str(Path(sys.executable).parent / "graphiti")
 
 from .installer import (
+    get_installed_git_hooks,
     install_claude_hook,
     install_git_hook,
-    is_git_hook_installed,
     uninstall_claude_hook,
     uninstall_git_hook,
 )
@@ -213,13 +213,16 @@ def get_hook_status(repo_path: Path) -> Dict[str, object]:
     Returns:
         Dict with:
         - "hooks_enabled": bool from config
-        - "git_hook_installed": bool from is_git_hook_installed()
+        - "git_hook_installed": bool, post-commit hook has a graphiti section
+        - "git_hooks_installed": set of all git hook types with a graphiti section
         - "claude_hook_installed": bool (check .claude/settings.json)
         - "repo_path": str(repo_path)
     """
+    git_hooks = get_installed_git_hooks(repo_path)
     return {
         "hooks_enabled": get_hooks_enabled(),
-        "git_hook_installed": is_git_hook_installed(repo_path),
+        "git_hook_installed": "post-commit" in git_hooks,
+        "git_hooks_installed": git_hooks,
         "claude_hook_installed": _is_claude_hook_installed(repo_path),
         "repo_path": str(repo_path),
     }
@@ -23,6 +23,7 @@ import structlog
 from rich.console import Console
 
 from src.capture.git_capture import fetch_commit_diff
+from src.config.paths import get_project_db_path
 from src.indexer.extraction import extract_commit_knowledge
 from src.indexer.quality_gate import should_skip_commit
 from src.indexer.state import (
@@ -35,6 +36,7 @@ from src.indexer.state import (
     save_state,
 )
 from src.models import GraphScope
+from src.storage.write_generation import bump_write_generation
 
 logger = structlog.get_logger()
 
@@ -295,6 +297,11 @@ class GitIndexer:
         except Exception as e:
             self._logger.error("iteration_failed", error=str(e))
 
+        # Extraction writes episodes straight through graphiti; invalidate
+        # caches keyed on the project's write generation
+        if commits_processed:
+            bump_write_generation(get_project_db_path(self.project_root))
+
         # Update last_run_at timestamp
         state.last_run_at = datetime.now(timezone.utc).isoformat()
         save_state(self.project_root, state)
@@ -347,6 +354,7 @@ class GitIndexer:
                 if uuids:
                     from graphiti_core.nodes import Node
                     await Node.delete_by_uuids(driver, uuids)
+                    bump_write_generation(get_project_db_path(self.project_root))
                     self._logger.info("deleted_git_history_episodes", count=len(uuids))
                 else:
                     self._logger.debug("no_git_history_episodes_to_delete")
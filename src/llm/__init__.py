@@ -23,17 +23,41 @@ Error handling:
     The exception includes the queue ID for tracking.
 """
 
-from .client import LLMUnavailableError, OllamaClient
+from typing import TYPE_CHECKING
+
 from .config import LLMConfig, load_config
-from .queue import LLMRequestQueue, QueuedRequest
-from .quota import QuotaInfo, QuotaTracker
+
+if TYPE_CHECKING:
+    from .client import LLMUnavailableError, OllamaClient
+    from .queue import LLMRequestQueue, QueuedRequest
+    from .quota import QuotaInfo, QuotaTracker
+
+# Names re-exported from submodules that import the ollama client library,
+# loaded on first access so importing src.llm for its config stays cheap
+_LAZY_EXPORTS = {
+    "LLMUnavailableError": "client",
+    "OllamaClient": "client",
+    "LLMRequestQueue": "queue",
+    "QueuedRequest": "queue",
+    "QuotaInfo": "quota",
+    "QuotaTracker": "quota",
+}
 
 # Singleton client management
-_client: OllamaClient | None = None
+_client: "OllamaClient | None" = None
 _config: LLMConfig | None = None
 
 
-def get_client(config: LLMConfig | None = None) -> OllamaClient:
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_client(config: LLMConfig | None = None) -> "OllamaClient":
     """Get or create the singleton OllamaClient.
 
     Args:
@@ -45,6 +69,7 @@ def get_client(config: LLMConfig | None = None) -> OllamaClient:
     """
     global _client, _config
     if _client is None:
+        from .client import OllamaClient
         _config = config or load_config()
         _client = OllamaClient(_config)
     return _client
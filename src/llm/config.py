@@ -12,6 +12,36 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
+# Parsed TOML files keyed by path, validated by (mtime_ns, size)
+_TOML_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+
+def read_config_toml(config_path: Path) -> dict:
+    """Parse a TOML config file, reusing the result while the file is unchanged.
+
+    The returned dict is shared with the cache and must not be mutated;
+    deep-copy it before making changes.
+
+    Args:
+        config_path: Path to TOML config file
+
+    Returns:
+        Parsed TOML as a dict, or an empty dict if the file does not exist
+    """
+    if not config_path.exists():
+        return {}
+
+    st = config_path.stat()
+    cached = _TOML_CACHE.get(config_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    with open(config_path, "rb") as f:
+        data = tomllib.load(f)
+    _TOML_CACHE[config_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
 @dataclass(frozen=True)
 class LLMConfig:
     """LLM configuration.
@@ -75,10 +105,7 @@ def load_config(config_path: Path | None = None) -> LLMConfig:
         config_path = Path.home() / ".graphiti" / "llm.toml"
 
     # Load TOML config if exists
-    config_data = {}
-    if config_path.exists():
-        with open(config_path, "rb") as f:
-            config_data = tomllib.load(f)
+    config_data = read_config_toml(config_path)
 
     # Extract values from TOML structure
     cloud = config_data.get("cloud", {})
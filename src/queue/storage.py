@@ -379,6 +379,45 @@ class JobQueue:
         finally:
             conn.close()
 
+    def retry_all_dead_letter(self) -> int:
+        """Move every dead letter job back to the main queue for retry.
+
+        Reads and clears the dead letter table in a single transaction, then
+        requeues the jobs in the order they failed with reset attempts.
+
+        Returns:
+            Number of jobs requeued
+        """
+        conn = sqlite3.connect(str(self._dead_letter_db))
+        try:
+            with conn:
+                rows = conn.execute("""
+                    SELECT id, job_type, payload, parallel, created_at
+                    FROM dead_letter_jobs
+                    ORDER BY failed_at ASC
+                """).fetchall()
+                conn.execute("DELETE FROM dead_letter_jobs")
+        finally:
+            conn.close()
+
+        for job_id, job_type, payload, parallel, created_at in rows:
+            job = QueuedJob(
+                id=job_id,
+                job_type=job_type,
+                payload=json.loads(payload),
+                parallel=bool(parallel),
+                created_at=created_at,
+                status=JobStatus.PENDING,
+                attempts=0,
+                last_error=None
+            )
+            self._queue.put(asdict(job))
+
+        if rows:
+            self._logger.info("dead_letter_jobs_retried", count=len(rows))
+
+        return len(rows)
+
     def get_stats(self) -> QueueStats:
         """Get queue statistics.
 
@@ -1,4 +1,12 @@
 from src.storage.selector import GraphSelector
-from src.storage.graph_manager import GraphManager
 
 __all__ = ["GraphSelector", "GraphManager"]
+
+
+def __getattr__(name: str):
+    # GraphManager pulls in graphiti_core and kuzu; load it on first access
+    # so importing GraphSelector (e.g. for CLI scope resolution) stays cheap
+    if name == "GraphManager":
+        from src.storage.graph_manager import GraphManager
+        return GraphManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,30 @@ from pathlib import Path
 from typing import Optional, Tuple
 from src.models import GraphScope
 
+# Git roots found per start path, oldest dropped first past the limit. Only
+# hits are memoized, so a `git init` after a miss is still picked up.
+_git_roots: dict[Path, Path] = {}
+_GIT_ROOTS_SIZE = 8
+
+
+def _find_git_root(start: Path) -> Optional[Path]:
+    """Walk up from start to the first directory containing a .git directory.
+
+    Memoized per process: a CLI invocation may resolve scope several times
+    from the same working directory.
+    """
+    root = _git_roots.get(start)
+    if root is not None:
+        return root
+
+    for parent in [start, *start.parents]:
+        if (parent / ".git").is_dir():
+            if len(_git_roots) >= _GIT_ROOTS_SIZE:
+                del _git_roots[next(iter(_git_roots))]
+            _git_roots[start] = parent
+            return parent
+    return None
+
 
 class GraphSelector:
     """Selects appropriate graph scope based on context.
@@ -20,15 +44,7 @@ class GraphSelector:
         Returns:
             Path to project root if found, None if not in a git repository
         """
-        current = start_path or Path.cwd()
-
-        # Walk up directory tree looking for .git
-        for parent in [current, *current.parents]:
-            git_dir = parent / ".git"
-            if git_dir.exists() and git_dir.is_dir():
-                return parent
-
-        return None
+        return _find_git_root(start_path or Path.cwd())
 
     @staticmethod
     def determine_scope(
@@ -0,0 +1,50 @@
+"""Per-database write generation counters.
+
+Kuzu updates the database file's mtime and header page every time it is
+closed, even after read-only work, so file metadata cannot tell whether the
+graph changed. Code that writes to a graph bumps a small counter stored next
+to the database instead, and caches keyed on the counter (see src.cli.cache)
+are invalidated by any write.
+
+Kuzu holds an exclusive lock on the database while it is open, so a writer
+bumps the counter before any other process can open the graph and read it.
+"""
+from pathlib import Path
+
+
+def _generation_path(db_path: Path) -> Path:
+    """Return the counter file stored next to a database."""
+    return db_path.with_name(db_path.name + ".generation")
+
+
+def read_write_generation(db_path: Path) -> int:
+    """Return the write generation of a database (0 if never bumped).
+
+    Args:
+        db_path: Kuzu database path
+
+    Returns:
+        Current write generation
+    """
+    try:
+        return int(_generation_path(db_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0
+
+
+def bump_write_generation(db_path: Path) -> None:
+    """Record that a database was written to.
+
+    Call after every write to the graph. Best-effort: failures to write the
+    counter are ignored.
+
+    Args:
+        db_path: Kuzu database path
+    """
+    path = _generation_path(db_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_text(str(read_write_generation(db_path) + 1), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        pass
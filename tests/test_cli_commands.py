@@ -209,6 +209,42 @@ def test_search_with_limit(mock_resolve_scope, mock_search):
     assert result.exit_code == 0
 
 
+@patch("src.cli.commands.search.resolve_scope")
+def test_search_passes_filters_to_service(mock_resolve_scope):
+    """Test date/type/tag filters are parsed and handed to GraphService.search."""
+    from datetime import datetime, timedelta, timezone
+    from unittest.mock import AsyncMock
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    service = Mock()
+    service.search = AsyncMock(return_value=[])
+
+    with patch("src.graph.get_service", return_value=service):
+        result = runner.invoke(app, [
+            "search", "test", "--since", "7d", "--before", "2026-01-01",
+            "--type", "relationship", "--tag", "planning",
+        ])
+
+    assert result.exit_code == 0
+    kwargs = service.search.call_args.kwargs
+    expected_since = datetime.now(timezone.utc) - timedelta(days=7)
+    assert abs((kwargs["since"] - expected_since).total_seconds()) < 60
+    assert kwargs["before"] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert kwargs["type_filter"] == "relationship"
+    assert kwargs["tags"] == ["planning"]
+
+
+@patch("src.cli.commands.search.resolve_scope")
+def test_search_invalid_since(mock_resolve_scope):
+    """Test an unparseable --since value is reported as a bad parameter."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+
+    result = runner.invoke(app, ["search", "test", "--since", "last tuesday"])
+
+    assert result.exit_code == 2
+
+
 # ==================== List Command Tests ====================
 
 
@@ -228,6 +264,21 @@ def test_list_basic(mock_resolve_scope, mock_list):
     assert result.exit_code == 0
 
 
+@patch("src.cli.commands.list_cmd._list_entities")
+@patch("src.cli.commands.list_cmd.resolve_scope")
+def test_list_passes_filters(mock_resolve_scope, mock_list):
+    """Test --type and --tag are forwarded to the service query."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    mock_list.return_value = []
+
+    runner.invoke(app, ["list", "--type", "entity", "--tag", "a", "--tag", "b"])
+
+    _, kwargs = mock_list.call_args
+    assert kwargs["type_filter"] == "entity"
+    assert kwargs["tags"] == ["a", "b"]
+
+
 @patch("src.cli.commands.list_cmd._list_entities")
 @patch("src.cli.commands.list_cmd.resolve_scope")
 def test_list_json(mock_resolve_scope, mock_list):
@@ -279,6 +330,26 @@ def test_list_compact(mock_resolve_scope, mock_list):
     assert result.exit_code == 0
 
 
+@patch("src.cli.commands.list_cmd._list_entities")
+@patch("src.cli.commands.list_cmd.resolve_scope")
+def test_list_tags_joined_only_for_display(mock_resolve_scope, mock_list):
+    """Test tag lists stay lists in JSON and are joined in table/compact views."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    entity = {"name": "entity1", "type": "entity", "tags": ["alpha", "beta"],
+              "relationship_count": 1, "created_at": "2026-01-01"}
+
+    mock_list.return_value = [dict(entity)]
+    result = runner.invoke(app, ["list", "--format", "json"])
+    data, _ = json.JSONDecoder().raw_decode(result.stdout)  # count line follows
+    assert data[0]["tags"] == ["alpha", "beta"]
+
+    for args in (["list"], ["list", "--compact"]):
+        mock_list.return_value = [dict(entity)]
+        result = runner.invoke(app, args)
+        assert "alpha, beta" in result.stdout
+
+
 # ==================== Show Command Tests ====================
 
 
@@ -329,21 +400,87 @@ def test_show_json_format(mock_resolve_scope, mock_find_entity):
     assert result.exit_code == 0
 
 
+@patch("src.cli.commands.show._find_entity")
+@patch("src.cli.commands.show.resolve_scope")
+def test_show_not_found(mock_resolve_scope, mock_find_entity):
+    """Test show exits with an error when no entity matches."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    mock_find_entity.return_value = None
+
+    result = runner.invoke(app, ["show", "missing"])
+
+    assert result.exit_code == 1
+    assert "not found" in result.output
+
+
+@patch("src.cli.commands.show._find_entity")
+@patch("src.cli.commands.show.resolve_scope")
+def test_show_ambiguous_uses_selected_match(mock_resolve_scope, mock_find_entity):
+    """Test choosing among ambiguous matches does not query the graph again."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    mock_find_entity.return_value = [
+        {"id": f"uuid-{i}", "name": f"entity_{i}", "type": "entity", "scope": "global",
+         "created_at": "2026-01-01T00:00:00Z", "updated_at": "2026-01-01T00:00:00Z"}
+        for i in (1, 2)
+    ]
+
+    result = runner.invoke(app, ["show", "entity"], input="2\n")
+
+    assert result.exit_code == 0
+    mock_find_entity.assert_called_once()
+    assert "ID:          uuid-2" in result.stdout
+
+
+@patch("src.cli.commands.show._find_entity")
+@patch("src.cli.commands.show.resolve_scope")
+def test_show_ambiguous_json_lists_matches(mock_resolve_scope, mock_find_entity):
+    """Test --format json emits all ambiguous matches without prompting."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    matches = [{"id": f"uuid-{i}", "name": f"entity_{i}", "type": "entity"} for i in (1, 2)]
+    mock_find_entity.return_value = matches
+
+    result = runner.invoke(app, ["show", "entity", "--format", "json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == matches
+
+
+@patch("src.cli.commands.show._find_entity")
+@patch("src.cli.commands.show.resolve_scope")
+def test_show_ambiguous_invalid_selection(mock_resolve_scope, mock_find_entity):
+    """Test a non-numeric or out-of-range selection exits with an error."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    mock_find_entity.return_value = [
+        {"id": f"uuid-{i}", "name": f"entity_{i}", "type": "entity"} for i in (1, 2)
+    ]
+
+    for answer in ("abc\n", "3\n", "\u00b2\n", ""):
+        result = runner.invoke(app, ["show", "entity"], input=answer)
+        assert result.exit_code == 1
+        assert "Invalid selection" in result.output
+
+
 # ==================== Delete Command Tests ====================
 
 
 @patch("src.cli.commands.delete._delete_entities")
-@patch("src.cli.commands.delete._resolve_entity")
+@patch("src.cli.commands.delete._resolve_entities")
 @patch("src.cli.commands.delete.resolve_scope")
 def test_delete_with_force(mock_resolve_scope, mock_resolve_entity, mock_delete):
     """Test delete with --force flag."""
     from src.models import GraphScope
     mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
     mock_resolve_entity.return_value = {
-        "id": "test_001",
-        "name": "entity1",
-        "type": "test",
-        "scope": "global"
+        "entity1": {
+            "id": "test_001",
+            "name": "entity1",
+            "type": "test",
+            "scope": "global"
+        }
     }
     mock_delete.return_value = 1
 
@@ -352,17 +489,19 @@ def test_delete_with_force(mock_resolve_scope, mock_resolve_entity, mock_delete)
     assert result.exit_code == 0
 
 
-@patch("src.cli.commands.delete._resolve_entity")
+@patch("src.cli.commands.delete._resolve_entities")
 @patch("src.cli.commands.delete.resolve_scope")
 def test_delete_confirmation_declined(mock_resolve_scope, mock_resolve_entity):
     """Test delete prompts for confirmation and handles decline."""
     from src.models import GraphScope
     mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
     mock_resolve_entity.return_value = {
-        "id": "test_001",
-        "name": "entity1",
-        "type": "test",
-        "scope": "global"
+        "entity1": {
+            "id": "test_001",
+            "name": "entity1",
+            "type": "test",
+            "scope": "global"
+        }
     }
 
     result = runner.invoke(app, ["delete", "entity1"], input="n\n")
@@ -372,17 +511,19 @@ def test_delete_confirmation_declined(mock_resolve_scope, mock_resolve_entity):
 
 
 @patch("src.cli.commands.delete._delete_entities")
-@patch("src.cli.commands.delete._resolve_entity")
+@patch("src.cli.commands.delete._resolve_entities")
 @patch("src.cli.commands.delete.resolve_scope")
 def test_delete_json(mock_resolve_scope, mock_resolve_entity, mock_delete):
     """Test delete with JSON output."""
     from src.models import GraphScope
     mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
     mock_resolve_entity.return_value = {
-        "id": "test_001",
-        "name": "entity1",
-        "type": "test",
-        "scope": "global"
+        "entity1": {
+            "id": "test_001",
+            "name": "entity1",
+            "type": "test",
+            "scope": "global"
+        }
     }
     mock_delete.return_value = 1
 
@@ -391,6 +532,48 @@ def test_delete_json(mock_resolve_scope, mock_resolve_entity, mock_delete):
     assert result.exit_code == 0
 
 
+@patch("src.cli.commands.delete._delete_entities")
+@patch("src.cli.commands.delete._resolve_entities")
+@patch("src.cli.commands.delete.resolve_scope")
+def test_delete_multiple_resolves_once(mock_resolve_scope, mock_resolve_entities, mock_delete):
+    """Test deleting several entities resolves all names in one call."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    mock_resolve_entities.return_value = {
+        name: {"id": name, "name": name, "type": "test", "scope": "global"}
+        for name in ("entity1", "entity2")
+    }
+    mock_delete.return_value = 2
+
+    result = runner.invoke(app, ["delete", "entity1", "entity2", "--force"])
+
+    assert result.exit_code == 0
+    mock_resolve_entities.assert_called_once_with(["entity1", "entity2"], GraphScope.GLOBAL, None)
+    mock_delete.assert_called_once_with(["entity1", "entity2"], GraphScope.GLOBAL, None)
+
+
+@patch("src.cli.commands.delete._delete_entities")
+@patch("src.cli.commands.delete._resolve_entities")
+@patch("src.cli.commands.delete.resolve_scope")
+def test_delete_ambiguous_reprompts_on_invalid_choice(mock_resolve_scope, mock_resolve_entities, mock_delete):
+    """Test an out-of-range selection prompts again instead of exiting."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+    mock_resolve_entities.return_value = {
+        "entity": [
+            {"id": "e1", "name": "entity one", "type": "test", "scope": "global"},
+            {"id": "e2", "name": "entity two", "type": "test", "scope": "global"},
+        ]
+    }
+    mock_delete.return_value = 1
+
+    result = runner.invoke(app, ["delete", "entity", "--force"], input="5\n2\n")
+
+    assert result.exit_code == 0
+    assert mock_resolve_entities.call_count == 1
+    mock_delete.assert_called_once_with(["entity two"], GraphScope.GLOBAL, None)
+
+
 # ==================== Summarize Command Tests ====================
 
 
@@ -453,10 +636,11 @@ def test_summarize_json(mock_resolve_scope, mock_load, mock_summarize):
 # ==================== Compact Command Tests ====================
 
 
+@patch("src.cli.commands.compact._has_duplicates", return_value=True)
 @patch("src.cli.commands.compact._compact_graph")
 @patch("src.cli.commands.compact._get_graph_stats")
 @patch("src.cli.commands.compact.resolve_scope")
-def test_compact_with_force(mock_resolve_scope, mock_stats, mock_compact):
+def test_compact_with_force(mock_resolve_scope, mock_stats, mock_compact, mock_has_dups):
     """Test compact with --force flag."""
     from src.models import GraphScope
     mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
@@ -476,11 +660,23 @@ def test_compact_with_force(mock_resolve_scope, mock_stats, mock_compact):
     result = runner.invoke(app, ["compact", "--force"])
 
     assert result.exit_code == 0
+    # No progress bar when output is not a terminal
+    assert mock_compact.call_args.kwargs["progress"] is None
 
+    # On a terminal the progress bar is driven by the service's stage callback
+    from src.cli.output import console
+    with patch.object(type(console), "is_terminal", new=True):
+        result = runner.invoke(app, ["compact", "--force"])
+        assert callable(mock_compact.call_args.kwargs["progress"])
 
+        runner.invoke(app, ["compact", "--force", "--quiet"])
+        assert mock_compact.call_args.kwargs["progress"] is None
+
+
+@patch("src.cli.commands.compact._has_duplicates", return_value=True)
 @patch("src.cli.commands.compact._get_graph_stats")
 @patch("src.cli.commands.compact.resolve_scope")
-def test_compact_declined(mock_resolve_scope, mock_stats):
+def test_compact_declined(mock_resolve_scope, mock_stats, mock_has_dups):
     """Test compact prompts for confirmation and handles decline."""
     from src.models import GraphScope
     mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
@@ -499,10 +695,11 @@ def test_compact_declined(mock_resolve_scope, mock_stats):
     assert "Cancelled" in output or "cancelled" in output.lower()
 
 
+@patch("src.cli.commands.compact._has_duplicates", return_value=True)
 @patch("src.cli.commands.compact._compact_graph")
 @patch("src.cli.commands.compact._get_graph_stats")
 @patch("src.cli.commands.compact.resolve_scope")
-def test_compact_json(mock_resolve_scope, mock_stats, mock_compact):
+def test_compact_json(mock_resolve_scope, mock_stats, mock_compact, mock_has_dups):
     """Test compact with JSON output."""
     from src.models import GraphScope
     mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
@@ -524,6 +721,22 @@ def test_compact_json(mock_resolve_scope, mock_stats, mock_compact):
     assert result.exit_code == 0
 
 
+@patch("src.cli.commands.compact._compact_graph")
+@patch("src.cli.commands.compact._get_graph_stats")
+@patch("src.cli.commands.compact._has_duplicates", return_value=False)
+@patch("src.cli.commands.compact.resolve_scope")
+def test_compact_clean_graph_skips_stats(mock_resolve_scope, mock_has_dups, mock_stats, mock_compact):
+    """Test a clean graph short-circuits before full stats are computed."""
+    from src.models import GraphScope
+    mock_resolve_scope.return_value = (GraphScope.GLOBAL, None)
+
+    result = runner.invoke(app, ["compact", "--force"])
+
+    assert "No compaction needed" in result.stdout
+    mock_stats.assert_not_called()
+    mock_compact.assert_not_called()
+
+
 # ==================== Config Command Tests ====================
 
 
@@ -600,9 +813,48 @@ def test_config_json(mock_load_config):
         pytest.fail("Output is not valid JSON")
 
 
+@patch("src.cli.commands.config.load_config")
+def test_config_set_then_get(mock_load_config, tmp_path):
+    """Test --set writes the key that --get reads back."""
+    mock_load_config.return_value = _create_mock_config()
+    config_path = tmp_path / "llm.toml"
+
+    with patch("src.cli.commands.config._get_config_path", return_value=config_path):
+        result = runner.invoke(app, ["config", "--set", "retry.max_attempts=7"])
+        assert result.exit_code == 0
+
+        result = runner.invoke(app, ["config", "--get", "retry.max_attempts"])
+
+    assert result.exit_code == 0
+    assert result.stdout.strip() == "7"
+
+
+def test_config_write_toml_escapes_strings(tmp_path):
+    """Test _write_toml output round-trips strings that need escaping."""
+    import tomllib
+    from src.cli.commands.config import _write_toml
+
+    config_dict = {
+        "cloud": {"endpoint": 'http://host/"quoted"\\path\nnext', "api_key": "k\x7fey"},
+        "local": {"models": ["a\"b", "c"], "auto_start": True},
+    }
+    path = tmp_path / "llm.toml"
+
+    _write_toml(config_dict, path)
+
+    with open(path, "rb") as f:
+        assert tomllib.load(f) == config_dict
+
+
 # ==================== Health Command Tests ====================
 
 
+@pytest.fixture(autouse=True)
+def _isolated_health_cache(tmp_path, monkeypatch):
+    """Keep health check results out of the user's real cache."""
+    monkeypatch.setattr("src.cli.cache.HEALTH_CACHE_PATH", tmp_path / "health.json")
+
+
 @patch("src.cli.commands.health._check_quota")
 @patch("src.cli.commands.health._check_database")
 @patch("src.cli.commands.health._check_ollama_local")
@@ -610,16 +862,20 @@ def test_config_json(mock_load_config):
 @patch("src.cli.commands.health.GraphSelector.find_project_root")
 def test_health_basic(mock_find_root, mock_cloud, mock_local, mock_db, mock_quota):
     """Test health command basic invocation."""
+    from src.cli.commands.health import HealthCheck
+
     mock_find_root.return_value = None
-    mock_cloud.return_value = {"name": "Cloud Ollama", "status": "ok", "detail": "Connected"}
-    mock_local.return_value = {"name": "Local Ollama", "status": "ok", "detail": "Running"}
-    mock_db.return_value = {"name": "Database (global)", "status": "ok", "detail": "Initialized"}
-    mock_quota.return_value = {"name": "Quota", "status": "ok", "detail": "50% used"}
+    mock_cloud.return_value = HealthCheck("Cloud Ollama", "ok", "Connected")
+    mock_local.return_value = HealthCheck("Local Ollama", "ok", "Running")
+    mock_db.return_value = HealthCheck("Database (global)", "ok", "Initialized")
+    mock_quota.return_value = HealthCheck("Quota", "ok", "50% used")
 
     result = runner.invoke(app, ["health"])
 
     # Exit code 0 if healthy
     assert result.exit_code == 0
+    # Verbose-only details are skipped on a plain run
+    mock_local.assert_called_once_with(False)
 
 
 @patch("src.cli.commands.health._check_quota")
@@ -629,15 +885,20 @@ def test_health_basic(mock_find_root, mock_cloud, mock_local, mock_db, mock_quot
 @patch("src.cli.commands.health.GraphSelector.find_project_root")
 def test_health_verbose(mock_find_root, mock_cloud, mock_local, mock_db, mock_quota):
     """Test health with --verbose flag."""
+    from src.cli.commands.health import HealthCheck
+
     mock_find_root.return_value = None
-    mock_cloud.return_value = {"name": "Cloud Ollama", "status": "ok", "detail": "Connected"}
-    mock_local.return_value = {"name": "Local Ollama", "status": "ok", "detail": "Running", "models": ["llama3"]}
-    mock_db.return_value = {"name": "Database (global)", "status": "ok", "detail": "Initialized"}
-    mock_quota.return_value = {"name": "Quota", "status": "ok", "detail": "50% used"}
+    mock_cloud.return_value = HealthCheck("Cloud Ollama", "ok", "Connected")
+    mock_local.return_value = HealthCheck("Local Ollama", "ok", "Running", extras={"models": ["llama3"]})
+    mock_db.return_value = HealthCheck("Database (global)", "ok", "Initialized")
+    mock_quota.return_value = HealthCheck("Quota", "ok", "50% used")
 
     result = runner.invoke(app, ["health", "--verbose"])
 
     assert result.exit_code == 0
+    mock_local.assert_called_once_with(True)
+    mock_quota.assert_called_once_with(True)
+    assert "Models: llama3" in result.stdout
 
 
 @patch("src.cli.commands.health._check_quota")
@@ -647,11 +908,13 @@ def test_health_verbose(mock_find_root, mock_cloud, mock_local, mock_db, mock_qu
 @patch("src.cli.commands.health.GraphSelector.find_project_root")
 def test_health_json(mock_find_root, mock_cloud, mock_local, mock_db, mock_quota):
     """Test health with JSON output."""
+    from src.cli.commands.health import HealthCheck
+
     mock_find_root.return_value = None
-    mock_cloud.return_value = {"name": "Cloud Ollama", "status": "ok", "detail": "Connected"}
-    mock_local.return_value = {"name": "Local Ollama", "status": "ok", "detail": "Running"}
-    mock_db.return_value = {"name": "Database (global)", "status": "ok", "detail": "Initialized"}
-    mock_quota.return_value = {"name": "Quota", "status": "ok", "detail": "50% used"}
+    mock_cloud.return_value = HealthCheck("Cloud Ollama", "ok", "Connected")
+    mock_local.return_value = HealthCheck("Local Ollama", "ok", "Running")
+    mock_db.return_value = HealthCheck("Database (global)", "ok", "Initialized")
+    mock_quota.return_value = HealthCheck("Quota", "ok", "50% used")
 
     result = runner.invoke(app, ["health", "--format", "json"])
 
@@ -661,3 +924,171 @@ def test_health_json(mock_find_root, mock_cloud, mock_local, mock_db, mock_quota
         json.loads(result.stdout)
     except json.JSONDecodeError:
         pytest.fail("Output is not valid JSON")
+
+
+@patch("src.cli.commands.health._check_quota")
+@patch("src.cli.commands.health._check_database")
+@patch("src.cli.commands.health._check_ollama_local")
+@patch("src.cli.commands.health._check_ollama_cloud")
+@patch("src.cli.commands.health.GraphSelector.find_project_root")
+def test_health_includes_project_database(mock_find_root, mock_cloud, mock_local, mock_db, mock_quota):
+    """Test health checks the project database in display order when in a project."""
+    from src.cli.commands.health import HealthCheck
+
+    mock_find_root.return_value = Path("/fake/project")
+    mock_cloud.return_value = HealthCheck("Cloud Ollama", "ok", "Connected")
+    mock_local.return_value = HealthCheck("Local Ollama", "ok", "Running")
+    mock_db.side_effect = lambda scope_name, db_path: HealthCheck(
+        f"Database ({scope_name})", "ok", "Initialized"
+    )
+    mock_quota.return_value = HealthCheck("Quota", "ok", "50% used")
+
+    result = runner.invoke(app, ["health", "--format", "json"])
+
+    assert result.exit_code == 0
+    names = [c["name"] for c in json.loads(result.stdout)["checks"]]
+    assert names == [
+        "Cloud Ollama", "Local Ollama", "Database (global)", "Database (project)", "Quota",
+    ]
+
+
+@patch("src.cli.commands.health._check_quota")
+@patch("src.cli.commands.health._check_database")
+@patch("src.cli.commands.health._check_ollama_local")
+@patch("src.cli.commands.health._check_ollama_cloud")
+@patch("src.cli.commands.health.GraphSelector.find_project_root")
+def test_health_reuses_passing_results(mock_find_root, mock_cloud, mock_local, mock_db, mock_quota):
+    """Test passing checks are served from cache and failures are re-run."""
+    from src.cli.commands.health import HealthCheck
+
+    mock_find_root.return_value = None
+    mock_cloud.return_value = HealthCheck("Cloud Ollama", "ok", "Connected")
+    mock_local.return_value = HealthCheck("Local Ollama", "error", "Not running")
+    mock_db.return_value = HealthCheck("Database (global)", "ok", "Initialized")
+    mock_quota.return_value = HealthCheck("Quota", "ok", "50% used")
+
+    runner.invoke(app, ["health", "--format", "json"])
+    runner.invoke(app, ["health", "--format", "json"])
+
+    assert mock_cloud.call_count == 1
+    assert mock_local.call_count == 2
+
+    runner.invoke(app, ["health", "--format", "json", "--no-cache"])
+
+    assert mock_cloud.call_count == 2
+
+
+def test_health_db_dir_stats(tmp_path):
+    """Test database stats count top-level entries and sum nested file sizes."""
+    from src.cli.commands.health import _db_dir_stats
+
+    (tmp_path / "graphiti.kuzu").write_bytes(b"x" * 100)
+    (tmp_path / "graphiti.kuzu.wal").write_bytes(b"x" * 20)
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "part").write_bytes(b"x" * 5)
+
+    assert _db_dir_stats(tmp_path) == (3, 125, False)
+
+
+def test_health_check_dict_roundtrip():
+    """Test HealthCheck flattens extras for JSON/cache and rebuilds from it."""
+    from src.cli.commands.health import HealthCheck
+
+    check = HealthCheck("Database (global)", "ok", "Initialized", extras={"size_mb": 1.5})
+    data = check.to_dict()
+
+    assert data == {"name": "Database (global)", "status": "ok", "detail": "Initialized", "size_mb": 1.5}
+    assert HealthCheck.from_dict(data) == check
+
+
+def test_health_database_not_initialized(tmp_path):
+    """Test a missing database directory is reported as a warning."""
+    import asyncio
+    from src.cli.commands.health import _check_database
+
+    result = asyncio.run(_check_database("global", tmp_path / "missing"))
+
+    assert result.status == "warning"
+    assert "Not initialized" in result.detail
+
+
+def test_health_db_dir_stats_stops_at_ceiling(tmp_path):
+    """Test the database walk stops early once the size ceiling is passed."""
+    from src.cli.commands.health import _db_dir_stats
+
+    for i in range(5):
+        (tmp_path / f"part{i}").write_bytes(b"x" * 10)
+
+    entry_count, size_bytes, truncated = _db_dir_stats(tmp_path, max_bytes=15)
+
+    assert truncated is True
+    assert size_bytes == 20
+    assert entry_count == 2
+
+
+def _run_cloud_check(handler):
+    """Run _check_ollama_cloud against a mock HTTP transport."""
+    import asyncio
+    import functools
+    import httpx
+    from src.cli.commands import health
+
+    config = Mock(cloud_api_key="key", cloud_endpoint="https://cloud.example")
+    client_cls = functools.partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+    with patch("src.llm.load_config", return_value=config), \
+         patch("httpx.AsyncClient", client_cls):
+        return asyncio.run(health._check_ollama_cloud())
+
+
+def test_health_cloud_falls_back_to_get():
+    """Test the cloud check retries with GET when HEAD is not allowed."""
+    import httpx
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        return httpx.Response(405 if request.method == "HEAD" else 200)
+
+    result = _run_cloud_check(handler)
+
+    assert methods == ["HEAD", "GET"]
+    assert result.status == "ok"
+
+
+def test_health_cloud_reports_rejected_key():
+    """Test an auth failure is reported as reachable with a rejected key."""
+    import httpx
+
+    result = _run_cloud_check(lambda request: httpx.Response(401))
+
+    assert result.status == "error"
+    assert "API key rejected" in result.detail
+
+
+def test_health_cloud_client_closed_after_check():
+    """Test the cloud check closes its HTTP client and sends the bearer key."""
+    import asyncio
+    import httpx
+    from src.cli.commands import health
+
+    seen = []
+    clients = []
+    client_cls = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        client = client_cls(transport=httpx.MockTransport(handler), **kwargs)
+        clients.append(client)
+        return client
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200)
+
+    config = Mock(cloud_api_key="key", cloud_endpoint="https://cloud.example")
+    with patch("src.llm.load_config", return_value=config), \
+         patch("httpx.AsyncClient", make_client):
+        result = asyncio.run(health._check_ollama_cloud())
+
+    assert result.status == "ok"
+    assert seen == ["Bearer key"]
+    assert [c.is_closed for c in clients] == [True]
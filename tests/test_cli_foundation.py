@@ -4,9 +4,10 @@ Tests the CLI app instance, version handling, utils (typo suggestions, scope
 resolution, exit codes), input handling, and output functions.
 """
 import json
+import os
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 import typer
@@ -62,6 +63,56 @@ def test_app_version():
     assert "graphiti version" in result.stdout.lower() or "0.1.0" in result.stdout
 
 
+def test_fast_path_version(capsys):
+    """Test bare --version is answered without invoking Typer."""
+    from src.entry import _fast_path
+
+    assert _fast_path(["--version"]) is True
+    assert "graphiti version" in capsys.readouterr().out
+
+
+def test_fast_path_falls_through_for_subcommands():
+    """Test subcommands are left for Typer to parse."""
+    from src.entry import _fast_path
+
+    assert _fast_path(["list", "--format", "json"]) is False
+    assert _fast_path(["--help"]) is False
+
+
+def test_fast_path_requires_exact_version_flag():
+    """Test abbreviated, bundled or valued version flags are left to Typer."""
+    from src.entry import _fast_path
+
+    for argv in (["--ver"], ["-vv"], ["--version=1"], ["-v", "list"]):
+        assert _fast_path(argv) is False
+
+
+def test_lazy_group_builds_only_invoked_command():
+    """Test a lazy command group materialises just the requested subcommand."""
+    from src.cli.commands.queue_cmd import queue_app
+
+    for name in ("queue_status", "queue_process", "queue_retry"):
+        sys.modules.pop(f"src.cli.commands.{name}", None)
+
+    group = typer.main.get_group(queue_app)
+    assert group.commands == {}
+    assert group.list_commands(None) == ["status", "process", "retry"]
+    assert group.get_command(None, "retry").name == "retry"
+    assert list(group.commands) == ["retry"]
+    # Only the invoked subcommand's module is imported
+    assert "src.cli.commands.queue_retry" in sys.modules
+    assert "src.cli.commands.queue_status" not in sys.modules
+
+
+def test_lazy_group_help_lists_all_commands():
+    """Test --help on a lazy group still lists every subcommand."""
+    result = runner.invoke(app, ["queue", "--help"])
+
+    assert result.exit_code == 0
+    for cmd in ["status", "process", "retry"]:
+        assert cmd in result.stdout
+
+
 # ==================== Utils Tests ====================
 
 
@@ -153,20 +204,38 @@ def test_confirm_action_force():
     assert result is True
 
 
-def test_confirm_action_no_force_declines():
+@patch("sys.stdin")
+def test_confirm_action_no_force_declines(mock_stdin):
     """Test confirm_action with user declining."""
+    mock_stdin.isatty.return_value = True
     with patch("typer.confirm", return_value=False):
         result = confirm_action("Delete everything?", force=False)
         assert result is False
 
 
-def test_confirm_action_no_force_accepts():
+@patch("sys.stdin")
+def test_confirm_action_no_force_accepts(mock_stdin):
     """Test confirm_action with user accepting."""
+    mock_stdin.isatty.return_value = True
     with patch("typer.confirm", return_value=True):
         result = confirm_action("Delete everything?", force=False)
         assert result is True
 
 
+@patch("sys.stdin")
+def test_confirm_action_piped_stdin(mock_stdin):
+    """Test confirm_action reads a plain line when stdin is not a TTY."""
+    mock_stdin.isatty.return_value = False
+    with patch("builtins.input", return_value="Yes\n") as mock_input, \
+         patch("typer.confirm") as mock_confirm:
+        assert confirm_action("Delete everything?", force=False) is True
+        mock_input.assert_called_once()
+        mock_confirm.assert_not_called()
+
+    with patch("builtins.input", side_effect=EOFError):
+        assert confirm_action("Delete everything?", force=False) is False
+
+
 # ==================== Input Tests ====================
 
 
@@ -198,21 +267,28 @@ def test_read_content_none_tty_raises(mock_stdin):
 def test_read_content_from_stdin(mock_stdin):
     """Test read_content reads from stdin when available."""
     mock_stdin.isatty.return_value = False
-    mock_stdin.read.return_value = "  piped content  \n"
-    mock_stdin.reconfigure = Mock()
+    mock_stdin.buffer.read.return_value = b"  piped caf\xc3\xa9 \xff  \n"
 
     content = read_content(None)
 
-    assert content == "piped content"
-    mock_stdin.reconfigure.assert_called_once_with(encoding='utf-8', errors='replace')
+    assert content == "piped café \ufffd"
+    mock_stdin.reconfigure.assert_not_called()
+
+
+@patch("sys.stdin")
+def test_read_content_strips_unicode_whitespace(mock_stdin):
+    """Test whitespace is stripped after decoding as well as before."""
+    mock_stdin.isatty.return_value = False
+    mock_stdin.buffer.read.return_value = "\u3000piped content\u3000\n".encode()
+
+    assert read_content(None) == "piped content"
 
 
 @patch("sys.stdin")
 def test_read_content_empty_stdin_raises(mock_stdin):
     """Test read_content raises when stdin is empty."""
     mock_stdin.isatty.return_value = False
-    mock_stdin.read.return_value = "   \n  "
-    mock_stdin.reconfigure = Mock()
+    mock_stdin.buffer.read.return_value = b"   \n  "
 
     with pytest.raises(typer.BadParameter) as exc_info:
         read_content(None)
@@ -245,3 +321,320 @@ def test_print_error_with_suggestion():
     """Test print_error with suggestion parameter."""
     # Just verify it doesn't crash
     print_error("test error", suggestion="Try this instead")
+
+
+def test_print_table_streams_rows_with_column_aliases():
+    """Test print_table accepts a generator and aliased column keys."""
+    from src.cli.output import print_table
+
+    rows = ({"name": f"e{i}", "relationship_count": i} for i in range(2))
+    with console.capture() as capture:
+        print_table(rows, columns=["name", "Relations"], column_keys={"Relations": "relationship_count"})
+
+    out = capture.get()
+    assert "Relations" in out
+    assert "e1" in out and "1" in out
+
+
+def test_print_table_handles_rows_missing_columns():
+    """Test rows without some columns render those cells empty."""
+    from src.cli.output import print_table
+
+    with console.capture() as capture:
+        print_table([{"name": "full", "type": "entity"}, {"name": "ragged"}], columns=["name", "type"])
+
+    out = capture.get()
+    assert "full" in out and "ragged" in out
+
+
+def test_print_table_truncates_long_cells():
+    """Test cells longer than the column budget are cut with an ellipsis."""
+    from src.cli.output import _MAX_CELL_WIDTH, print_table
+
+    with console.capture() as capture:
+        print_table([{"name": "x" * 500}])
+
+    out = capture.get()
+    assert "…" in out
+    assert "x" * (_MAX_CELL_WIDTH + 1) not in out.replace("\n", "").replace("│", "").replace(" ", "")
+
+
+def test_print_table_large_result_falls_back_to_tsv(capsys):
+    """Test results over the Rich row limit are written as tab-separated text."""
+    from src.cli.output import _MAX_RICH_TABLE_ROWS, print_table
+
+    rows = ({"name": f"e{i}", "tags": ["a", "b"]} for i in range(_MAX_RICH_TABLE_ROWS + 1))
+    print_table(rows, columns=["Name", "Tags"], column_keys={"Name": "name", "Tags": "tags"})
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "Name\tTags"
+    assert lines[1] == "e0\ta, b"
+    assert len(lines) == _MAX_RICH_TABLE_ROWS + 2
+
+
+def test_print_table_tsv_keeps_full_cells_and_title(capsys):
+    """Test the TSV fallback neither truncates cells nor drops the title."""
+    from src.cli.output import _MAX_CELL_WIDTH, _MAX_RICH_TABLE_ROWS, print_table
+
+    long_name = "x" * (_MAX_CELL_WIDTH * 2)
+    rows = [{"name": long_name, "snippet": "a\tb\nc\\d"}]
+    rows += [{"name": f"e{i}", "snippet": ""} for i in range(_MAX_RICH_TABLE_ROWS)]
+    print_table(rows, title="Entities")
+
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert lines[1] == f"{long_name}\ta\\tb\\nc\\\\d"
+    assert "Entities" in captured.err
+
+
+def test_print_table_empty_iterable():
+    """Test print_table reports no results for an empty generator."""
+    from src.cli.output import print_table
+
+    with console.capture() as capture:
+        print_table(iter([]))
+
+    assert "No results" in capture.get()
+
+
+def test_print_compact_piped_writes_plain_lines(capsys):
+    """Test print_compact writes unstyled lines when stdout is not a terminal."""
+    from src.cli.output import print_compact
+
+    print_compact([
+        {"name": "[x] a", "type": "entity", "snippet": "s" * 70},
+        {"name": "b", "type": "", "snippet": ""},
+    ])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == [f"[x] a (entity) - {'s' * 60}...", "b"]
+
+
+def test_maybe_status_skips_spinner_when_piped():
+    """Test maybe_status only starts a Rich spinner on a terminal."""
+    from contextlib import nullcontext
+
+    from src.cli.output import maybe_status
+
+    with patch.object(type(console), "is_terminal", new=False):
+        assert isinstance(maybe_status("Working..."), nullcontext)
+    with patch.object(type(console), "is_terminal", new=True):
+        assert not isinstance(maybe_status("Working..."), nullcontext)
+
+
+def test_print_json_piped_writes_plain_json(capsys):
+    """Test print_json writes unstyled JSON when stdout is not a terminal."""
+    from src.cli.output import print_json
+
+    print_json({"name": "café", "items": [1, 2]})
+
+    out = capsys.readouterr().out
+    assert "\x1b[" not in out
+    assert json.loads(out) == {"name": "café", "items": [1, 2]}
+
+
+def test_print_json_stringifies_datetimes(capsys):
+    """Test values the stdlib cannot encode are written as strings."""
+    from datetime import datetime
+
+    from src.cli.output import print_json
+
+    print_json({"created_at": datetime(2026, 1, 2, 3, 4, 5)})
+
+    assert json.loads(capsys.readouterr().out)["created_at"].startswith("2026-01-02")
+
+
+def test_print_json_piped_writes_orjson_bytes(monkeypatch, capsysbinary):
+    """Test orjson output is written to the stdout byte buffer when piped."""
+    import types
+
+    import src.cli.output as output
+
+    fake_orjson = types.SimpleNamespace(
+        OPT_INDENT_2=1,
+        OPT_NON_STR_KEYS=2,
+        OPT_APPEND_NEWLINE=4,
+        dumps=lambda data, option: (json.dumps(data, ensure_ascii=False) + "\n").encode(),
+    )
+    monkeypatch.setattr(output, "orjson", fake_orjson)
+
+    output.print_json({"name": "café"})
+
+    assert capsysbinary.readouterr().out == '{"name": "café"}\n'.encode()
+
+
+# ==================== Stats Cache Tests ====================
+
+
+@pytest.fixture
+def stats_cache(tmp_path, monkeypatch):
+    """Point the stats cache and global DB path at a temp directory."""
+    import src.cli.cache as cache
+
+    db_path = tmp_path / "global" / "graphiti.kuzu"
+    db_path.parent.mkdir()
+    db_path.write_bytes(b"db")
+    monkeypatch.setattr(cache, "STATS_CACHE_PATH", tmp_path / "cache" / "stats.json")
+    monkeypatch.setattr(cache, "GLOBAL_DB_PATH", db_path)
+    return cache, db_path
+
+
+def test_stats_cache_roundtrip(stats_cache):
+    """Test cached stats are returned while the DB is unchanged."""
+    cache, _ = stats_cache
+    stats = {"entity_count": 3, "duplicate_count": 0}
+
+    assert cache.get_cached_stats(GraphScope.GLOBAL, None) is None
+    cache.set_cached_stats(GraphScope.GLOBAL, None, stats)
+    assert cache.get_cached_stats(GraphScope.GLOBAL, None) == stats
+
+
+def test_stats_cache_stale_after_db_write(stats_cache):
+    """Test a change to the DB files invalidates the cached entry."""
+    cache, db_path = stats_cache
+    cache.set_cached_stats(GraphScope.GLOBAL, None, {"entity_count": 3})
+
+    db_path.write_bytes(b"db-changed")
+
+    assert cache.get_cached_stats(GraphScope.GLOBAL, None) is None
+
+
+def test_stats_cache_stale_after_write_generation_bump(stats_cache):
+    """Test a write recorded by the graph service invalidates the cached entry."""
+    from src.storage.write_generation import bump_write_generation
+
+    cache, db_path = stats_cache
+    cache.set_cached_stats(GraphScope.GLOBAL, None, {"entity_count": 3})
+
+    bump_write_generation(db_path)
+
+    assert cache.get_cached_stats(GraphScope.GLOBAL, None) is None
+
+
+def test_stats_cache_invalidate(stats_cache):
+    """Test invalidate_stats drops the entry for a scope."""
+    cache, _ = stats_cache
+    cache.set_cached_stats(GraphScope.GLOBAL, None, {"entity_count": 3})
+
+    cache.invalidate_stats(GraphScope.GLOBAL, None)
+
+    assert cache.get_cached_stats(GraphScope.GLOBAL, None) is None
+
+
+_STATS_RUN = """
+import json
+from src.cli import cache
+from src.models import GraphScope
+from src.storage.graph_manager import GraphManager
+
+hit = cache.get_cached_stats(GraphScope.GLOBAL, None)
+GraphManager().get_driver(GraphScope.GLOBAL)
+if hit is None:
+    cache.set_cached_stats(GraphScope.GLOBAL, None, {"entity_count": 1})
+print(json.dumps(hit))
+"""
+
+
+def test_stats_cache_hits_in_later_process(tmp_path):
+    """Test stats cached by one CLI run are reused by the next one.
+
+    Each run opens and closes the real Kuzu database in its own process, so
+    the checkpoint Kuzu does on close happens between runs.
+    """
+    pytest.importorskip("graphiti_core")
+    kuzu = pytest.importorskip("kuzu")
+    import subprocess
+
+    env = {**os.environ, "HOME": str(tmp_path)}
+    repo_root = Path(__file__).resolve().parent.parent
+
+    def stats_run():
+        proc = subprocess.run(
+            [sys.executable, "-c", _STATS_RUN],
+            cwd=repo_root, env=env, capture_output=True, text=True, check=True,
+        )
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+
+    # First runs create the database and settle its initial checkpoint
+    stats_run()
+    stats_run()
+    assert stats_run() == {"entity_count": 1}
+
+    # A write, recorded the way the graph service records its writes
+    from src.storage.write_generation import bump_write_generation
+
+    db_path = tmp_path / ".graphiti" / "global" / "graphiti.kuzu"
+    db = kuzu.Database(str(db_path))
+    kuzu.Connection(db).execute("CREATE NODE TABLE Probe(id INT64, PRIMARY KEY(id))")
+    db.close()
+    bump_write_generation(db_path)
+
+    assert stats_run() is None
+
+
+def test_search_cache_roundtrip_and_stale(stats_cache, tmp_path, monkeypatch):
+    """Test cached search results are dropped once the DB changes."""
+    cache, db_path = stats_cache
+    monkeypatch.setattr(cache, "SEARCH_CACHE_PATH", tmp_path / "cache" / "search.json")
+    results = [{"name": "e1", "type": "relationship"}]
+
+    assert cache.get_cached_search(GraphScope.GLOBAL, None, "q") is None
+    cache.set_cached_search(GraphScope.GLOBAL, None, "q", results)
+    assert cache.get_cached_search(GraphScope.GLOBAL, None, "q") == results
+
+    db_path.write_bytes(b"db-changed")
+
+    assert cache.get_cached_search(GraphScope.GLOBAL, None, "q") is None
+
+
+def test_search_cache_stale_after_graph_write(stats_cache, tmp_path, monkeypatch):
+    """Test a write through the graph service drops cached search results."""
+    import asyncio
+    from unittest.mock import AsyncMock, Mock
+
+    from src.graph.service import GraphService
+
+    cache, db_path = stats_cache
+    monkeypatch.setattr(cache, "SEARCH_CACHE_PATH", tmp_path / "cache" / "search.json")
+    cache.set_cached_search(GraphScope.GLOBAL, None, "q", [{"name": "e1"}])
+
+    service = GraphService.__new__(GraphService)
+    driver = Mock(execute_query=AsyncMock(return_value=([{"uuid": "u1"}], None, None)))
+    service._get_graphiti = AsyncMock(return_value=Mock(driver=driver))
+    service._get_group_id = lambda scope, project_root: "global"
+    monkeypatch.setattr("src.graph.service.GLOBAL_DB_PATH", db_path)
+    monkeypatch.setattr("src.graph.service.Node.delete_by_uuids", AsyncMock())
+
+    asyncio.run(service.delete_entities(["e1"], GraphScope.GLOBAL, None))
+
+    assert cache.get_cached_search(GraphScope.GLOBAL, None, "q") is None
+
+
+def test_search_cache_evicts_oldest(stats_cache, tmp_path, monkeypatch):
+    """Test the per-scope search cache stays bounded."""
+    cache, _ = stats_cache
+    monkeypatch.setattr(cache, "SEARCH_CACHE_PATH", tmp_path / "cache" / "search.json")
+    monkeypatch.setattr(cache, "_SEARCH_CACHE_SIZE", 2)
+
+    for key in ("a", "b", "c"):
+        cache.set_cached_search(GraphScope.GLOBAL, None, key, [{"name": key}])
+
+    assert cache.get_cached_search(GraphScope.GLOBAL, None, "a") is None
+    assert cache.get_cached_search(GraphScope.GLOBAL, None, "c") == [{"name": "c"}]
+
+
+def test_search_cache_project_scope_stays_in_project(stats_cache, tmp_path, monkeypatch):
+    """Test project search results are cached under the project's .graphiti/."""
+    cache, _ = stats_cache
+    global_cache = tmp_path / "cache" / "search.json"
+    monkeypatch.setattr(cache, "SEARCH_CACHE_PATH", global_cache)
+    project_root = tmp_path / "project"
+    (project_root / ".graphiti").mkdir(parents=True)
+    (project_root / ".graphiti" / "graphiti.kuzu").write_bytes(b"db")
+    results = [{"name": "e1", "type": "relationship"}]
+
+    cache.set_cached_search(GraphScope.PROJECT, project_root, "q", results)
+
+    assert cache.get_cached_search(GraphScope.PROJECT, project_root, "q") == results
+    assert (project_root / ".graphiti" / "cache" / "search.json").exists()
+    assert not global_cache.exists()
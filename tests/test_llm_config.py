@@ -10,7 +10,7 @@ from pathlib import Path
 
 import pytest
 
-from src.llm.config import LLMConfig, load_config, get_state_path
+from src.llm.config import LLMConfig, load_config, get_state_path, read_config_toml
 
 
 class TestConfigDefaults:
@@ -192,6 +192,36 @@ class TestConfigImmutability:
             config.retry_max_attempts = 10
 
 
+class TestReadConfigToml:
+    """Test cached TOML parsing."""
+
+    def test_reuses_parse_while_unchanged(self, tmp_path):
+        """Unchanged file returns the same parsed dict without re-reading."""
+        config_file = tmp_path / "llm.toml"
+        config_file.write_text('[retry]\nmax_attempts = 5\n')
+
+        first = read_config_toml(config_file)
+        second = read_config_toml(config_file)
+
+        assert first == {"retry": {"max_attempts": 5}}
+        assert second is first
+
+    def test_reparses_after_change(self, tmp_path):
+        """Modified file is parsed again."""
+        config_file = tmp_path / "llm.toml"
+        config_file.write_text('[retry]\nmax_attempts = 5\n')
+        read_config_toml(config_file)
+
+        config_file.write_text('[retry]\nmax_attempts = 10\n')
+        os.utime(config_file, ns=(0, 1_000_000_000))
+
+        assert read_config_toml(config_file) == {"retry": {"max_attempts": 10}}
+
+    def test_missing_file(self, tmp_path):
+        """Missing file yields an empty dict."""
+        assert read_config_toml(tmp_path / "missing.toml") == {}
+
+
 class TestStatePath:
     """Test state path resolution."""
 
@@ -232,3 +232,36 @@ class TestFlow3Integration:
             f"dead_letter={stats.dead_letter}. "
             "Dispatch fix may not be applied correctly."
         )
+
+
+# ---------------------------------------------------------------------------
+# Class 4: dead letter retry
+# ---------------------------------------------------------------------------
+
+class TestRetryAllDeadLetter:
+    """JobQueue.retry_all_dead_letter() requeues every dead letter job at once."""
+
+    def test_requeues_all_jobs_and_clears_table(self, tmp_path):
+        """All dead letter jobs return to the main queue with reset attempts."""
+        queue = JobQueue(db_path=tmp_path / "queue")
+        for i in range(3):
+            job = _make_job("add_knowledge", {"n": i}, job_id=f"job-{i}")
+            job["attempts"] = 3
+            queue.move_to_dead_letter(job, "boom")
+        assert queue.get_stats().dead_letter == 3
+
+        assert queue.retry_all_dead_letter() == 3
+
+        assert queue.get_stats().dead_letter == 0
+        assert queue.get_pending_count() == 3
+        # Sequential jobs come back one per batch, in the order they failed
+        items = [queue.get_batch(max_items=3)[0] for _ in range(3)]
+        assert [item["id"] for item in items] == ["job-0", "job-1", "job-2"]
+        assert all(item["attempts"] == 0 for item in items)
+
+    def test_empty_dead_letter_returns_zero(self, tmp_path):
+        """Nothing is requeued when the dead letter table is empty."""
+        queue = JobQueue(db_path=tmp_path / "queue")
+
+        assert queue.retry_all_dead_letter() == 0
+        assert queue.get_pending_count() == 0
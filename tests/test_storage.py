@@ -35,6 +35,14 @@ class TestGraphSelector:
         root = GraphSelector.find_project_root(tmp_path)
         assert root is None
 
+    def test_find_project_root_after_git_init(self, tmp_path):
+        """Should notice a repo created after an earlier miss."""
+        assert GraphSelector.find_project_root(tmp_path) is None
+
+        (tmp_path / ".git").mkdir()
+
+        assert GraphSelector.find_project_root(tmp_path) == tmp_path
+
     def test_determine_scope_preference_always_global(self, tmp_path):
         """Preferences should always use global scope."""
         (tmp_path / ".git").mkdir()
@@ -64,6 +72,22 @@ class TestGraphSelector:
         assert path is None
 
 
+class TestWriteGeneration:
+    """Tests for the per-database write generation counter."""
+
+    def test_bump_increments_generation(self, tmp_path):
+        """Should start at 0 and increase by one per bump."""
+        from src.storage.write_generation import bump_write_generation, read_write_generation
+
+        db_path = tmp_path / "graphiti.kuzu"
+        assert read_write_generation(db_path) == 0
+
+        bump_write_generation(db_path)
+        bump_write_generation(db_path)
+
+        assert read_write_generation(db_path) == 2
+
+
 class TestGraphManagerGlobal:
     """Tests for global scope database management."""
 